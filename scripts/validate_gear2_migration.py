@@ -10,19 +10,33 @@ Exit codes:
 - 1: One or more checks failed
 """
 
+import os
 import sys
 import tempfile
 import subprocess
 from pathlib import Path
 import shutil
 
+# Tool repository root (where this script's parent directory lives)
+TOOL_DIR = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(TOOL_DIR))
+
+from src.git_manager import GitManager
+from src.models import ProjectState, ProjectPhase
+from src.state_manager import StateManager
+
 
 class ValidationChecker:
-    """Runs validation checks for Phase 1.5"""
+    """Runs validation checks for Phase 1.5
+
+    Each check returns an ``(ok, message)`` tuple instead of raising.
+    """
 
     def __init__(self):
         self.passed = []
         self.failed = []
+        self._workspace = None
 
     def run_all_checks(self):
         """Run all validation checks"""
@@ -35,26 +49,42 @@ class ValidationChecker:
             ("Multi-Project", self.check_multi_project),
             ("Git Operations", self.check_git_operations),
             ("Gear 1 Compat", self.check_gear1_compatibility),
-            ("StateManager .moderator", self.check_state_manager_moderator),
         ]
 
+        # One scratch directory per run; each check works in its own subdir
+        # and everything is removed in a single cleanup at the end.
+        self._workspace = tempfile.TemporaryDirectory()
+
         for name, check_func in checks:
             print(f"\n{'='*70}")
             print(f"Checking: {name}")
             print('='*70)
 
+            # Checks report expected failures via their return value;
+            # only genuinely unexpected errors (e.g. a broken import) raise.
             try:
-                check_func()
-                self.passed.append(name)
-                print(f"✅ PASS: {name}")
-            except AssertionError as e:
-                self.failed.append((name, str(e)))
-                print(f"❌ FAIL: {name}")
-                print(f"   Error: {e}")
+                ok, message = check_func()
             except Exception as e:
                 self.failed.append((name, f"Unexpected error: {e}"))
                 print(f"❌ FAIL: {name} (unexpected error)")
                 print(f"   Error: {e}")
+                continue
+
+            if ok:
+                self.passed.append(name)
+                print(f"  ✓ {message}")
+                print(f"✅ PASS: {name}")
+            else:
+                self.failed.append((name, message))
+                print(f"❌ FAIL: {name}")
+                print(f"   Error: {message}")
+
+                # A polluted tool repo invalidates every later check
+                if check_func == self.check_tool_repo_clean:
+                    print("   Skipping remaining checks until the tool repo is clean")
+                    break
+
+        self._workspace.cleanup()
 
         # Print summary
         print(f"\n{'='*70}")
@@ -70,218 +100,185 @@ class ValidationChecker:
 
         return len(self.failed) == 0
 
+    def _check_dir(self, name):
+        """Create and return a per-check subdirectory of the run's workspace"""
+        path = Path(self._workspace.name) / name
+        path.mkdir()
+        return path
+
     def check_tool_repo_clean(self):
         """Verify tool repository doesn't get polluted"""
-        # Get tool repo directory (where this script lives)
-        script_dir = Path(__file__).parent
-        tool_dir = script_dir.parent
-
         # Check that no state/ directory exists in tool repo
-        tool_state = tool_dir / "state"
+        tool_state = TOOL_DIR / "state"
 
-        if tool_state.exists():
-            raise AssertionError(
+        if os.path.isdir(tool_state):
+            return False, (
                 f"Tool repository has 'state/' directory at {tool_state}. "
                 f"This indicates Gear 1 pollution. Delete it and re-test."
             )
 
-        print(f"  ✓ Tool repo is clean (no state/ at {tool_dir})")
+        return True, f"Tool repo is clean (no state/ at {TOOL_DIR})"
 
     def check_target_structure(self):
-        """Verify .moderator/ structure is correct"""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp) / "test-project"
-            target.mkdir()
-            (target / ".git").mkdir()
-
-            # Import and create StateManager
-            sys.path.insert(0, str(Path(__file__).parent.parent))
-            from src.state_manager import StateManager
+        """Verify StateManager creates the correct .moderator/ structure"""
+        target = self._check_dir("target_structure") / "test-project"
+        target.mkdir()
+
+        # Create state manager (should create .moderator/)
+        state_manager = StateManager(str(target / ".moderator" / "state"))
+
+        moderator_dir = target / ".moderator"
+        if not moderator_dir.is_dir():
+            return False, f"Missing directory: {moderator_dir}"
+
+        # Read the directory once instead of stat'ing each expected entry
+        with os.scandir(moderator_dir) as entries:
+            present_dirs = set()
+            has_gitignore = False
+            for entry in entries:
+                if entry.is_dir():
+                    present_dirs.add(entry.name)
+                elif entry.name == ".gitignore":
+                    has_gitignore = True
+
+        # Verify directories
+        required_dirs = ["state", "artifacts", "logs"]
+        missing_dirs = [name for name in required_dirs if name not in present_dirs]
+        if missing_dirs:
+            return False, f"Missing directory: {moderator_dir / missing_dirs[0]}"
+
+        # Verify .gitignore
+        if not has_gitignore:
+            return False, "Missing .moderator/.gitignore"
+
+        gitignore_lines = set((moderator_dir / ".gitignore").read_text().splitlines())
+        required_excludes = ["state/", "artifacts/", "logs/"]
+
+        for exclude in required_excludes:
+            if exclude not in gitignore_lines:
+                return False, f".gitignore missing '{exclude}'"
+
+        # Verify moderator_dir attribute exists and is correct
+        if not hasattr(state_manager, 'moderator_dir'):
+            return False, "StateManager missing moderator_dir attribute"
+
+        if state_manager.moderator_dir != moderator_dir:
+            return False, (
+                f"moderator_dir incorrect: {state_manager.moderator_dir}"
+            )
 
-            # Create state manager (should create .moderator/)
-            state_manager = StateManager(str(target / ".moderator" / "state"))
+        # Verify get_artifacts_dir uses .moderator/artifacts/
+        artifacts = state_manager.get_artifacts_dir("proj_test", "task_001")
 
-            # Verify directories
-            required_dirs = [
-                target / ".moderator",
-                target / ".moderator" / "state",
-                target / ".moderator" / "artifacts",
-                target / ".moderator" / "logs"
-            ]
+        if ".moderator" not in str(artifacts):
+            return False, (
+                f"Artifacts dir not under .moderator/: {artifacts}"
+            )
 
-            for dir_path in required_dirs:
-                if not dir_path.exists():
-                    raise AssertionError(f"Missing directory: {dir_path}")
+        if not artifacts.exists():
+            return False, f"Artifacts dir not created: {artifacts}"
 
-            print(f"  ✓ All .moderator/ subdirectories created")
+        return True, ".moderator/ subdirectories, .gitignore and artifacts layout correct"
 
-            # Verify .gitignore
-            gitignore = target / ".moderator" / ".gitignore"
-            if not gitignore.exists():
-                raise AssertionError("Missing .moderator/.gitignore")
+    def check_multi_project(self):
+        """Verify multi-project isolation works"""
+        tmp_path = self._check_dir("multi_project")
 
-            gitignore_content = gitignore.read_text()
-            required_excludes = ["state/", "artifacts/", "logs/"]
+        # Create two projects
+        project_a = tmp_path / "project-a"
+        project_a.mkdir()
 
-            for exclude in required_excludes:
-                if exclude not in gitignore_content:
-                    raise AssertionError(f".gitignore missing '{exclude}'")
+        project_b = tmp_path / "project-b"
+        project_b.mkdir()
 
-            print(f"  ✓ .gitignore created with correct exclusions")
+        # Create state managers
+        state_a = StateManager(str(project_a / ".moderator" / "state"))
+        state_b = StateManager(str(project_b / ".moderator" / "state"))
 
-    def check_multi_project(self):
-        """Verify multi-project isolation works"""
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-
-            # Create two projects
-            project_a = tmp_path / "project-a"
-            project_a.mkdir()
-            (project_a / ".git").mkdir()
-
-            project_b = tmp_path / "project-b"
-            project_b.mkdir()
-            (project_b / ".git").mkdir()
-
-            # Import
-            sys.path.insert(0, str(Path(__file__).parent.parent))
-            from src.state_manager import StateManager
-            from src.models import ProjectState, ProjectPhase
-
-            # Create state managers
-            state_a = StateManager(str(project_a / ".moderator" / "state"))
-            state_b = StateManager(str(project_b / ".moderator" / "state"))
-
-            # Create and save states
-            proj_a = ProjectState(
-                project_id="proj_aaa",
-                requirements="Project A",
-                phase=ProjectPhase.INITIALIZING
-            )
+        # Create and save states
+        proj_a = ProjectState(
+            project_id="proj_aaa",
+            requirements="Project A",
+            phase=ProjectPhase.INITIALIZING
+        )
 
-            proj_b = ProjectState(
-                project_id="proj_bbb",
-                requirements="Project B",
-                phase=ProjectPhase.INITIALIZING
-            )
+        proj_b = ProjectState(
+            project_id="proj_bbb",
+            requirements="Project B",
+            phase=ProjectPhase.INITIALIZING
+        )
 
-            state_a.save_project(proj_a)
-            state_b.save_project(proj_b)
+        state_a.save_project(proj_a)
+        state_b.save_project(proj_b)
 
-            # Verify isolation
-            loaded_a = state_a.load_project("proj_aaa")
-            loaded_b = state_b.load_project("proj_bbb")
+        # Verify isolation
+        loaded_a = state_a.load_project("proj_aaa")
+        loaded_b = state_b.load_project("proj_bbb")
 
-            if loaded_a is None:
-                raise AssertionError("Project A state not found")
+        if loaded_a is None:
+            return False, "Project A state not found"
 
-            if loaded_b is None:
-                raise AssertionError("Project B state not found")
+        if loaded_b is None:
+            return False, "Project B state not found"
 
-            # Verify cross-loading returns None
-            if state_a.load_project("proj_bbb") is not None:
-                raise AssertionError("Project A can see Project B's state (isolation broken)")
+        # Verify cross-loading returns None
+        if state_a.load_project("proj_bbb") is not None:
+            return False, "Project A can see Project B's state (isolation broken)"
 
-            if state_b.load_project("proj_aaa") is not None:
-                raise AssertionError("Project B can see Project A's state (isolation broken)")
+        if state_b.load_project("proj_aaa") is not None:
+            return False, "Project B can see Project A's state (isolation broken)"
 
-            print(f"  ✓ Multi-project isolation working")
+        return True, "Multi-project isolation working"
 
     def check_git_operations(self):
         """Verify git operations target correct repo"""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp) / "test-project"
-            target.mkdir()
-            (target / ".git").mkdir()
-
-            # Import GitManager
-            sys.path.insert(0, str(Path(__file__).parent.parent))
-            from src.git_manager import GitManager
+        target = self._check_dir("git_operations") / "test-project"
+        target.mkdir()
+        (target / ".git").mkdir()
 
-            # Create GitManager for target
-            git_manager = GitManager(str(target))
+        # Create GitManager for target
+        git_manager = GitManager(str(target))
 
-            # Verify repo_path is correct
-            if git_manager.repo_path != target.resolve():
-                raise AssertionError(
-                    f"GitManager repo_path incorrect: {git_manager.repo_path} != {target}"
-                )
+        # Verify repo_path is correct
+        if git_manager.repo_path != target.resolve():
+            return False, (
+                f"GitManager repo_path incorrect: {git_manager.repo_path} != {target}"
+            )
 
-            print(f"  ✓ GitManager targets correct repository")
+        return True, "GitManager targets correct repository"
 
     def check_gear1_compatibility(self):
         """Verify Gear 1 mode still works"""
-        with tempfile.TemporaryDirectory() as tmp:
-            project = Path(tmp) / "gear1-project"
-            project.mkdir()
-
-            # Import
-            sys.path.insert(0, str(Path(__file__).parent.parent))
-            from src.state_manager import StateManager
-            from src.models import ProjectState, ProjectPhase
-
-            # Use Gear 1 style path (no .moderator/)
-            state_manager = StateManager(str(project / "state"))
-
-            # Verify NO .moderator/ directory created
-            if (project / ".moderator").exists():
-                raise AssertionError(
-                    "Gear 1 mode created .moderator/ directory (should not)"
-                )
-
-            # Verify state/ directory created
-            if not (project / "state").exists():
-                raise AssertionError("Gear 1 mode didn't create state/ directory")
-
-            # Verify can save project
-            proj_state = ProjectState(
-                project_id="proj_test",
-                requirements="Test",
-                phase=ProjectPhase.INITIALIZING
-            )
-            state_manager.save_project(proj_state)
-
-            # Verify state file in correct location
-            state_file = project / "state" / "project_proj_test" / "project.json"
-            if not state_file.exists():
-                raise AssertionError(f"State file not created at {state_file}")
-
-            print(f"  ✓ Gear 1 compatibility maintained")
+        project = self._check_dir("gear1_compat") / "gear1-project"
+        project.mkdir()
 
-    def check_state_manager_moderator(self):
-        """Verify StateManager creates proper .moderator/ structure"""
-        with tempfile.TemporaryDirectory() as tmp:
-            target = Path(tmp) / "test-project"
-            target.mkdir()
+        # Use Gear 1 style path (no .moderator/)
+        state_manager = StateManager(str(project / "state"))
 
-            # Import
-            sys.path.insert(0, str(Path(__file__).parent.parent))
-            from src.state_manager import StateManager
-
-            # Create with .moderator/ path
-            state_manager = StateManager(str(target / ".moderator" / "state"))
-
-            # Verify moderator_dir attribute exists and is correct
-            if not hasattr(state_manager, 'moderator_dir'):
-                raise AssertionError("StateManager missing moderator_dir attribute")
-
-            if state_manager.moderator_dir != target / ".moderator":
-                raise AssertionError(
-                    f"moderator_dir incorrect: {state_manager.moderator_dir}"
-                )
+        # Verify NO .moderator/ directory created
+        if (project / ".moderator").exists():
+            return False, (
+                "Gear 1 mode created .moderator/ directory (should not)"
+            )
 
-            # Verify get_artifacts_dir uses .moderator/artifacts/
-            artifacts = state_manager.get_artifacts_dir("proj_test", "task_001")
+        # Verify state/ directory created
+        if not (project / "state").exists():
+            return False, "Gear 1 mode didn't create state/ directory"
 
-            if ".moderator" not in str(artifacts):
-                raise AssertionError(
-                    f"Artifacts dir not under .moderator/: {artifacts}"
-                )
+        # Verify can save project
+        proj_state = ProjectState(
+            project_id="proj_test",
+            requirements="Test",
+            phase=ProjectPhase.INITIALIZING
+        )
+        state_manager.save_project(proj_state)
 
-            if not artifacts.exists():
-                raise AssertionError(f"Artifacts dir not created: {artifacts}")
+        # Verify state file in correct location
+        state_file = project / "state" / "project_proj_test" / "project.json"
+        if not state_file.exists():
+            return False, f"State file not created at {state_file}"
 
-            print(f"  ✓ StateManager .moderator/ structure correct")
+        return True, "Gear 1 compatibility maintained"
 
 
 def main():
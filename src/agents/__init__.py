@@ -1,8 +1,28 @@
 """
 Agent implementations for Gear 2 two-agent system.
+
+Agents are imported lazily on first attribute access (PEP 562), so importing
+one agent module does not pull in the others.
 """
 
-from .base_agent import BaseAgent
-from .moderator_agent import ModeratorAgent
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'BaseAgent': 'base_agent',
+    'ModeratorAgent': 'moderator_agent',
+}
 
 __all__ = ['BaseAgent', 'ModeratorAgent']
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(f".{_LAZY_IMPORTS[name]}", __name__), name)
+        globals()[name] = value  # Cache so later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -4,16 +4,25 @@ Analyzer modules for the Ever-Thinker Continuous Improvement Engine.
 This package contains analyzer modules that detect improvement opportunities
 from different perspectives: performance, code quality, testing, documentation,
 UX, and architecture.
+
+The concrete analyzers are imported lazily on first attribute access
+(PEP 562), so importing one analyzer does not pull in the other five.
 """
 
+from importlib import import_module
+
 from .base_analyzer import Analyzer
 from .models import Improvement, ImprovementType, ImprovementPriority
-from .performance_analyzer import PerformanceAnalyzer
-from .code_quality_analyzer import CodeQualityAnalyzer
-from .testing_analyzer import TestingAnalyzer
-from .documentation_analyzer import DocumentationAnalyzer
-from .ux_analyzer import UXAnalyzer
-from .architecture_analyzer import ArchitectureAnalyzer
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'PerformanceAnalyzer': 'performance_analyzer',
+    'CodeQualityAnalyzer': 'code_quality_analyzer',
+    'TestingAnalyzer': 'testing_analyzer',
+    'DocumentationAnalyzer': 'documentation_analyzer',
+    'UXAnalyzer': 'ux_analyzer',
+    'ArchitectureAnalyzer': 'architecture_analyzer',
+}
 
 __all__ = [
     'Analyzer',
@@ -27,3 +36,15 @@ __all__ = [
     'UXAnalyzer',
     'ArchitectureAnalyzer',
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(f".{_LAZY_IMPORTS[name]}", __name__), name)
+        globals()[name] = value  # Cache so later lookups bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
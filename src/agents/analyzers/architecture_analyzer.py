@@ -11,16 +11,350 @@ in generated code, including:
 """
 
 import ast
+import logging
+import os
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 from collections import defaultdict
 
-from .base_analyzer import Analyzer
+from .base_analyzer import Analyzer, _DispatchVisitor, _FileCache, _order_by_priority, _parse_source
 from .models import Improvement, ImprovementType, ImprovementPriority
 
 if TYPE_CHECKING:
     from ...models import Task
 
 
+logger = logging.getLogger(__name__)
+
+
+# Method-name prefixes that indicate a concern; a method belongs to the first
+# concern (in this order) whose prefix it starts with
+_CONCERN_PATTERNS = {
+    'data': ['get_', 'set_', 'load_', 'save_', 'read_', 'write_'],
+    'validation': ['validate_', 'check_', 'verify_', 'is_valid'],
+    'formatting': ['format_', 'to_', 'as_', 'render_'],
+    'calculation': ['calculate_', 'compute_', 'sum_', 'count_'],
+    'network': ['fetch_', 'send_', 'request_', 'download_', 'upload_'],
+    'ui': ['display_', 'show_', 'render_', 'draw_'],
+    'persistence': ['save_', 'load_', 'store_', 'retrieve_', 'delete_'],
+}
+
+
+def _build_prefix_trie(patterns: dict[str, list[str]]) -> dict:
+    """
+    Build a character trie mapping each prefix to its concern.
+
+    Terminal nodes carry the concern under the '$' key (never a valid
+    identifier character). Prefixes shared by several concerns keep the
+    first concern, preserving the pattern table's precedence.
+    """
+    trie: dict = {}
+    for concern, prefixes in patterns.items():
+        for prefix in prefixes:
+            node = trie
+            for ch in prefix:
+                node = node.setdefault(ch, {})
+            node.setdefault('$', concern)
+    return trie
+
+
+_CONCERN_TRIE = _build_prefix_trie(_CONCERN_PATTERNS)
+
+# Instantiation counts stop here; anything above the tight-coupling
+# threshold (3) is reported the same way, so exact large counts are not needed
+_MAX_TRACKED_INSTANTIATIONS = 11
+
+# Node types that define a method when they appear directly in a class body
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Builtins whose use as an `if` test suggests type-based dispatch (OCP smell)
+_TYPE_CHECK_NAMES = frozenset({'isinstance', 'type'})
+
+# Improvement description text; only the per-class values vary
+_SRP_DESCRIPTION = (
+    "Class '{name}' at line {lineno} appears to have {count} distinct responsibilities: {concerns}. "
+    "The Single Responsibility Principle states a class should have only one reason to change. "
+    "Multiple responsibilities lead to: "
+    "1) Harder to understand and maintain, "
+    "2) Changes in one area risk breaking others, "
+    "3) Difficult to reuse parts independently, "
+    "4) Increased coupling between unrelated features. "
+    "Consider splitting into focused classes, each with a single clear purpose."
+)
+
+_OCP_DESCRIPTION = (
+    "Class '{name}' at line {lineno} uses type checking (isinstance/type) which may indicate "
+    "violation of the Open/Closed Principle (open for extension, closed for modification). "
+    "Type-based conditionals often mean: "
+    "1) Adding new types requires modifying existing code, "
+    "2) Logic is scattered across conditionals instead of type-specific implementations, "
+    "3) Difficult to add behavior without changing the class. "
+    "Consider using polymorphism: define an interface/base class and let subclasses provide type-specific behavior."
+)
+
+_GOD_OBJECT_DESCRIPTION = (
+    "Class '{name}' at line {lineno} has {count} public methods, "
+    "indicating it's a 'God object' with too many responsibilities. "
+    "God objects are anti-patterns because they: "
+    "1) Violate Single Responsibility Principle, "
+    "2) Are difficult to understand and test comprehensively, "
+    "3) Create bottlenecks (everything depends on them), "
+    "4) Make changes risky (high chance of breaking something). "
+    "Refactor by: "
+    "1) Identifying distinct responsibilities in the methods, "
+    "2) Extracting each responsibility into a focused class, "
+    "3) Using composition to coordinate the new classes, "
+    "4) Moving related data and behavior together."
+)
+
+_DATACLASS_DESCRIPTION = (
+    "Class '{name}' at line {lineno} appears to be a simple data container with only __init__. "
+    "Consider using @dataclass decorator which: "
+    "1) Reduces boilerplate code, "
+    "2) Auto-generates __init__, __repr__, __eq__, "
+    "3) Makes intent clearer, "
+    "4) Provides type safety with less code."
+)
+
+_CIRCULAR_DEPENDENCY_DESCRIPTION = (
+    "Circular dependency detected: {modules} import each other (directly or transitively). "
+    "Circular dependencies cause: "
+    "1) Import errors or initialization issues, "
+    "2) Difficulty understanding module relationships, "
+    "3) Impossible to test modules independently, "
+    "4) Tight coupling between modules. "
+    "Break the cycle by: "
+    "1) Moving shared code to a separate module both can import, "
+    "2) Using dependency injection instead of direct imports, "
+    "3) Introducing an interface/protocol layer, "
+    "4) Refactoring to eliminate the cyclic relationship."
+)
+
+_TIGHT_COUPLING_DESCRIPTION = (
+    "Class '{name}' at line {lineno} directly instantiates {count} other classes. "
+    "Direct instantiation creates tight coupling because: "
+    "1) Hard to test (can't mock dependencies), "
+    "2) Hard to reuse with different implementations, "
+    "3) Changes to dependencies require changes here. "
+    "Consider using dependency injection: "
+    "1) Pass dependencies via constructor (__init__), "
+    "2) Define interfaces for dependencies, "
+    "3) Use factory pattern for complex object creation, "
+    "4) Configure dependencies externally."
+)
+
+
+@dataclass
+class _ClassFacts:
+    """Facts about one class, gathered in a single traversal of its module."""
+    node: ast.ClassDef
+    name: str
+    lineno: int
+    # Methods defined directly in the class body (sync and async)
+    method_names: list[str] = field(default_factory=list)
+    public_method_count: int = 0
+    # True if the first __init__ only assigns more than three self attributes
+    trivial_dataclass_init: bool = False
+    # True if any `if isinstance(...)` / `if type(...)` appears in the class
+    has_type_conditional: bool = False
+    # Calls to capitalized names anywhere in the class (likely instantiations),
+    # saturating at _MAX_TRACKED_INSTANTIATIONS
+    instantiation_count: int = 0
+
+
+class _ArchFactsVisitor(_DispatchVisitor):
+    """
+    Walk a module once and collect _ClassFacts for every class in it.
+
+    Method-level facts come from a single scan of each class body. A class
+    context stack attributes conditionals and calls to every enclosing
+    class, matching what a per-class ast.walk would see.
+    """
+
+    def __init__(self):
+        self.classes: list[_ClassFacts] = []
+        # Imported module names, for the cross-file dependency graph
+        self.imports: set[str] = set()
+        self._class_stack: list[_ClassFacts] = []
+        super().__init__({
+            ast.ClassDef: self.visit_ClassDef,
+            ast.If: self.visit_If,
+            ast.Call: self.visit_Call,
+            ast.Import: self.visit_Import,
+            ast.ImportFrom: self.visit_ImportFrom,
+        })
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        facts = _ClassFacts(node=node, name=node.name, lineno=node.lineno)
+        # Methods are direct children of the class body; no need to search
+        # inside method bodies for them
+        function_nodes = _FUNCTION_NODES
+        function_def = ast.FunctionDef
+        method_names = facts.method_names
+        public_count = 0
+        init_method = None
+        for stmt in node.body:
+            if not isinstance(stmt, function_nodes):
+                continue
+            name = stmt.name
+            method_names.append(name)
+            if name[:1] != '_':
+                public_count += 1
+            elif init_method is None and name == '__init__' and type(stmt) is function_def:
+                init_method = stmt
+        facts.public_method_count = public_count
+
+        if init_method is not None:
+            facts.trivial_dataclass_init = _init_is_trivial_dataclass(init_method.body)
+
+        self.classes.append(facts)
+        self._class_stack.append(facts)
+        self.generic_visit(node)
+        self._class_stack.pop()
+
+    def visit_If(self, node: ast.If):
+        stack = self._class_stack
+        # Flags are set on the whole stack at once, so once the innermost
+        # class is flagged every enclosing class is too and the test
+        # inspection can be skipped
+        if stack and not stack[-1].has_type_conditional:
+            test = node.test
+            if (isinstance(test, ast.Call) and isinstance(test.func, ast.Name)
+                    and test.func.id in _TYPE_CHECK_NAMES):
+                for facts in stack:
+                    facts.has_type_conditional = True
+        self.generic_visit(node)
+
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            self.imports.add(alias.name)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if node.module:
+            self.imports.add(node.module)
+
+    def visit_Call(self, node: ast.Call):
+        stack = self._class_stack
+        # Enclosing classes count every call their inner classes count, so
+        # once the innermost count saturates all of them have
+        if stack and stack[-1].instantiation_count < _MAX_TRACKED_INSTANTIATIONS:
+            func = node.func
+            # Heuristic: capitalized names are likely classes
+            if type(func) is ast.Name and func.id[:1].isupper():
+                for facts in stack:
+                    if facts.instantiation_count < _MAX_TRACKED_INSTANTIATIONS:
+                        facts.instantiation_count += 1
+        self.generic_visit(node)
+
+
+def _init_is_trivial_dataclass(init_body: list[ast.stmt]) -> bool:
+    """
+    Return True if an __init__ body only does `self.attr = ...` assignments.
+
+    Docstrings are allowed but not counted; more than three assignments are
+    needed for the class to be worth converting to a dataclass.
+    """
+    Assign, Attribute, Name = ast.Assign, ast.Attribute, ast.Name
+    Expr, Constant = ast.Expr, ast.Constant
+    count = 0
+    for stmt in init_body:
+        if isinstance(stmt, Expr) and isinstance(stmt.value, Constant):
+            continue  # docstring
+        if not isinstance(stmt, Assign):
+            return False
+        # Check if it's self.attr = param pattern
+        target = stmt.targets[0]
+        if not (isinstance(target, Attribute) and
+                isinstance(target.value, Name) and
+                target.value.id == 'self'):
+            return False
+        count += 1
+    return count > 3
+
+
+def _file_to_module(file_path: str) -> str:
+    """Derive a dotted module name from a source file path."""
+    return os.path.splitext(os.path.normpath(file_path))[0].replace(os.sep, '.')
+
+
+def _find_import_cycles(import_graph: dict[str, set[str]]) -> list[list[str]]:
+    """
+    Return the import cycles in the graph as sorted lists of module names.
+
+    Uses an iterative Tarjan's strongly-connected-components search, so
+    cycles of any length are found in O(V + E) without recursion limits.
+    Only modules that are keys of the graph (i.e. analyzed files) can take
+    part in a cycle; edges to external modules are ignored.
+    """
+    # Work on integer node ids and adjacency lists; names are only needed
+    # again when reporting cycles
+    names = list(import_graph)
+    module_id = {name: i for i, name in enumerate(names)}
+    adjacency = [
+        [module_id[target] for target in import_graph[name] if target in module_id]
+        for name in names
+    ]
+
+    unvisited = -1
+    index = [unvisited] * len(names)
+    lowlink = [0] * len(names)
+    on_stack = [False] * len(names)
+    stack: list[int] = []
+    cycles: list[list[str]] = []
+    next_index = 0
+
+    for root in range(len(names)):
+        if index[root] != unvisited:
+            continue
+
+        index[root] = lowlink[root] = next_index
+        next_index += 1
+        stack.append(root)
+        on_stack[root] = True
+        # Each frame is (node, iterator over its successors)
+        work = [(root, iter(adjacency[root]))]
+
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if index[succ] == unvisited:
+                    index[succ] = lowlink[succ] = next_index
+                    next_index += 1
+                    stack.append(succ)
+                    on_stack[succ] = True
+                    work.append((succ, iter(adjacency[succ])))
+                    break
+                if on_stack[succ] and index[succ] < lowlink[node]:
+                    lowlink[node] = index[succ]
+            else:
+                # All successors done: pop the frame and propagate lowlink
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(names[member])
+                        if member == node:
+                            break
+                    if len(component) > 1:
+                        cycles.append(sorted(component))
+
+    return cycles
+
+
+def _collect_module_facts(tree: ast.AST) -> tuple[list[_ClassFacts], set[str]]:
+    """Return class facts and imported module names using one traversal."""
+    visitor = _ArchFactsVisitor()
+    visitor.visit(tree)
+    return visitor.classes, visitor.imports
+
+
 class ArchitectureAnalyzer(Analyzer):
     """
     Analyzer that detects architectural issues and design pattern violations.
@@ -29,6 +363,10 @@ class ArchitectureAnalyzer(Analyzer):
     Focuses on SOLID principles, design patterns, coupling, and cohesion.
     """
 
+    def __init__(self):
+        # Parsed trees, reused across analyze() calls while files are unchanged
+        self._ast_cache = _FileCache()
+
     @property
     def analyzer_name(self) -> str:
         """Return analyzer name."""
@@ -52,37 +390,60 @@ class ArchitectureAnalyzer(Analyzer):
         if not python_files:
             return improvements
 
-        # Run all detection methods
-        for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    code = f.read()
+        results = [self._analyze_file(file_path) for file_path in python_files]
 
-                # SOLID principles analysis
-                improvements.extend(self.check_solid_principles(code, file_path))
+        smell_inputs = []
+        for file_path, result in zip(python_files, results):
+            if result is None:
+                continue
+            file_improvements, file_coupling, imports = result
+            improvements.extend(file_improvements)
+            smell_inputs.append((file_path, file_coupling, imports))
 
-                # Design pattern violations
-                improvements.extend(self.detect_pattern_violations(code, file_path))
+        # Architectural smells that require multi-file analysis are built
+        # from the per-file results rather than re-parsing every file
+        improvements.extend(self._combine_smells(smell_inputs))
 
-            except SyntaxError as e:
-                print(f"Warning: Syntax error in {file_path}: {e}")
-                continue
-            except Exception as e:
-                print(f"Warning: Could not analyze {file_path}: {e}")
-                continue
+        # Order by priority: HIGH → MEDIUM → LOW
+        return _order_by_priority(improvements)
 
-        # Architectural smells that require multi-file analysis
-        improvements.extend(self.identify_architectural_smells(python_files))
+    def _analyze_file(
+        self, file_path: str
+    ) -> tuple[list[Improvement], list[Improvement], set[str]] | None:
+        """
+        Run every per-file check on one file.
 
-        # Sort by priority: HIGH → MEDIUM → LOW
-        priority_order = {
-            ImprovementPriority.HIGH: 0,
-            ImprovementPriority.MEDIUM: 1,
-            ImprovementPriority.LOW: 2,
-        }
-        improvements.sort(key=lambda imp: priority_order[imp.priority])
+        Args:
+            file_path: Path to the Python source file
 
-        return improvements
+        Returns:
+            (SOLID and pattern improvements, tight-coupling improvements,
+            imported module names), or None if the file could not be analyzed
+        """
+        try:
+            # Parse and traverse each file once; all checks share the facts
+            tree = self._parse_file(file_path)
+            class_facts, imports = _collect_module_facts(tree)
+
+            improvements = []
+
+            # SOLID principles analysis
+            improvements.extend(self._check_solid_principles(class_facts, file_path))
+
+            # Design pattern violations
+            improvements.extend(self._detect_pattern_violations(class_facts, file_path))
+
+            return (
+                improvements,
+                self._detect_tight_coupling(class_facts, file_path),
+                imports,
+            )
+
+        except SyntaxError as e:
+            logger.warning("Syntax error in %s: %s", file_path, e)
+        except Exception as e:
+            logger.warning("Could not analyze %s: %s", file_path, e)
+        return None
 
     def check_solid_principles(self, code: str, file_path: str) -> list[Improvement]:
         """
@@ -98,93 +459,73 @@ class ArchitectureAnalyzer(Analyzer):
         Returns:
             List of improvements for SOLID violations
         """
-        improvements = []
-
         try:
             tree = ast.parse(code, filename=file_path)
+            class_facts, _ = _collect_module_facts(tree)
+            return self._check_solid_principles(class_facts, file_path)
+        except Exception as e:
+            logger.warning("Could not check SOLID principles in %s: %s", file_path, e)
+            return []
 
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    # Detect SRP violations by analyzing method names for different concerns
-                    methods = [
-                        n.name for n in ast.walk(node)
-                        if isinstance(n, ast.FunctionDef) and n != node
-                    ]
-
-                    if not methods:
-                        continue
-
-                    # Heuristic: Group methods by concern based on prefixes/patterns
-                    concerns = self._identify_concerns(methods)
-
-                    # If class has 3+ distinct concerns, it likely violates SRP
-                    if len(concerns) >= 3:
-                        concern_list = ', '.join(concerns)
-
-                        improvements.append(Improvement.create(
-                            improvement_type=ImprovementType.ARCHITECTURE,
-                            priority=ImprovementPriority.MEDIUM,
-                            target_file=file_path,
-                            target_line=node.lineno,
-                            title=f"Class '{node.name}' violates Single Responsibility Principle",
-                            description=(
-                                f"Class '{node.name}' at line {node.lineno} appears to have {len(concerns)} distinct responsibilities: {concern_list}. "
-                                f"The Single Responsibility Principle states a class should have only one reason to change. "
-                                f"Multiple responsibilities lead to: "
-                                f"1) Harder to understand and maintain, "
-                                f"2) Changes in one area risk breaking others, "
-                                f"3) Difficult to reuse parts independently, "
-                                f"4) Increased coupling between unrelated features. "
-                                f"Consider splitting into focused classes, each with a single clear purpose."
-                            ),
-                            proposed_changes=(
-                                f"Split class '{node.name}' into separate classes for each responsibility: {concern_list}"
-                            ),
-                            rationale="Classes with multiple responsibilities violate SRP and are harder to maintain and test",
-                            impact="medium",
-                            effort="medium",
-                            analyzer_source=self.analyzer_name
-                        ))
-
-                    # Check for Open/Closed Principle violation (simplified heuristic)
-                    # Look for classes with many conditionals based on type checking
-                    has_type_conditionals = False
-                    for child in ast.walk(node):
-                        if isinstance(child, ast.If):
-                            # Check if conditional is checking types or isinstance
-                            if isinstance(child.test, ast.Call):
-                                if isinstance(child.test.func, ast.Name):
-                                    if child.test.func.id in ('isinstance', 'type'):
-                                        has_type_conditionals = True
-                                        break
-
-                    if has_type_conditionals and len(methods) > 5:
-                        improvements.append(Improvement.create(
-                            improvement_type=ImprovementType.ARCHITECTURE,
-                            priority=ImprovementPriority.MEDIUM,
-                            target_file=file_path,
-                            target_line=node.lineno,
-                            title=f"Class '{node.name}' may violate Open/Closed Principle",
-                            description=(
-                                f"Class '{node.name}' at line {node.lineno} uses type checking (isinstance/type) which may indicate "
-                                f"violation of the Open/Closed Principle (open for extension, closed for modification). "
-                                f"Type-based conditionals often mean: "
-                                f"1) Adding new types requires modifying existing code, "
-                                f"2) Logic is scattered across conditionals instead of type-specific implementations, "
-                                f"3) Difficult to add behavior without changing the class. "
-                                f"Consider using polymorphism: define an interface/base class and let subclasses provide type-specific behavior."
-                            ),
-                            proposed_changes=(
-                                f"Refactor type conditionals in '{node.name}' to use polymorphism (inheritance/interfaces)"
-                            ),
-                            rationale="Type checking violates Open/Closed Principle and makes adding new types require code changes",
-                            impact="medium",
-                            effort="medium",
-                            analyzer_source=self.analyzer_name
-                        ))
+    def _check_solid_principles(
+        self, class_facts: list[_ClassFacts], file_path: str
+    ) -> list[Improvement]:
+        """Emit SOLID violations from pre-collected class facts."""
+        improvements = []
 
-        except Exception as e:
-            print(f"Warning: Could not check SOLID principles in {file_path}: {e}")
+        for facts in class_facts:
+            node = facts.node
+
+            # Detect SRP violations by analyzing method names for different concerns
+            methods = facts.method_names
+
+            if not methods:
+                continue
+
+            # Heuristic: Group methods by concern based on prefixes/patterns
+            concerns = self._identify_concerns(methods)
+
+            # If class has 3+ distinct concerns, it likely violates SRP
+            if len(concerns) >= 3:
+                concern_list = ', '.join(concerns)
+
+                improvements.append(Improvement.create(
+                    improvement_type=ImprovementType.ARCHITECTURE,
+                    priority=ImprovementPriority.MEDIUM,
+                    target_file=file_path,
+                    target_line=node.lineno,
+                    title=f"Class '{node.name}' violates Single Responsibility Principle",
+                    description=_SRP_DESCRIPTION.format(
+                        name=node.name, lineno=node.lineno,
+                        count=len(concerns), concerns=concern_list,
+                    ),
+                    proposed_changes=(
+                        f"Split class '{node.name}' into separate classes for each responsibility: {concern_list}"
+                    ),
+                    rationale="Classes with multiple responsibilities violate SRP and are harder to maintain and test",
+                    impact="medium",
+                    effort="medium",
+                    analyzer_source=self.analyzer_name
+                ))
+
+            # Check for Open/Closed Principle violation (simplified heuristic)
+            # Look for classes with conditionals based on type checking
+            if facts.has_type_conditional and len(methods) > 5:
+                improvements.append(Improvement.create(
+                    improvement_type=ImprovementType.ARCHITECTURE,
+                    priority=ImprovementPriority.MEDIUM,
+                    target_file=file_path,
+                    target_line=node.lineno,
+                    title=f"Class '{node.name}' may violate Open/Closed Principle",
+                    description=_OCP_DESCRIPTION.format(name=node.name, lineno=node.lineno),
+                    proposed_changes=(
+                        f"Refactor type conditionals in '{node.name}' to use polymorphism (inheritance/interfaces)"
+                    ),
+                    rationale="Type checking violates Open/Closed Principle and makes adding new types require code changes",
+                    impact="medium",
+                    effort="medium",
+                    analyzer_source=self.analyzer_name
+                ))
 
         return improvements
 
@@ -202,96 +543,63 @@ class ArchitectureAnalyzer(Analyzer):
         Returns:
             List of improvements for pattern violations
         """
-        improvements = []
-
         try:
             tree = ast.parse(code, filename=file_path)
+            class_facts, _ = _collect_module_facts(tree)
+            return self._detect_pattern_violations(class_facts, file_path)
+        except Exception as e:
+            logger.warning("Could not detect pattern violations in %s: %s", file_path, e)
+            return []
 
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    # Count methods in the class
-                    methods = [
-                        n for n in node.body
-                        if isinstance(n, ast.FunctionDef) and not n.name.startswith('_')
-                    ]
-
-                    # God object heuristic: > 10 public methods
-                    if len(methods) > 10:
-                        improvements.append(Improvement.create(
-                            improvement_type=ImprovementType.ARCHITECTURE,
-                            priority=ImprovementPriority.HIGH,
-                            target_file=file_path,
-                            target_line=node.lineno,
-                            title=f"God object detected: class '{node.name}' has {len(methods)} public methods",
-                            description=(
-                                f"Class '{node.name}' at line {node.lineno} has {len(methods)} public methods, "
-                                f"indicating it's a 'God object' with too many responsibilities. "
-                                f"God objects are anti-patterns because they: "
-                                f"1) Violate Single Responsibility Principle, "
-                                f"2) Are difficult to understand and test comprehensively, "
-                                f"3) Create bottlenecks (everything depends on them), "
-                                f"4) Make changes risky (high chance of breaking something). "
-                                f"Refactor by: "
-                                f"1) Identifying distinct responsibilities in the methods, "
-                                f"2) Extracting each responsibility into a focused class, "
-                                f"3) Using composition to coordinate the new classes, "
-                                f"4) Moving related data and behavior together."
-                            ),
-                            proposed_changes=(
-                                f"Decompose God object '{node.name}' into smaller, focused classes (aim for < 10 methods per class)"
-                            ),
-                            rationale="God objects with > 10 public methods are difficult to maintain and violate good OO design",
-                            impact="high",
-                            effort="large",
-                            analyzer_source=self.analyzer_name
-                        ))
-
-                    # Check for data classes that should use dataclass decorator
-                    # Heuristic: class with only __init__ and simple attribute assignments
-                    if len(methods) == 0 and any(isinstance(n, ast.FunctionDef) and n.name == '__init__' for n in node.body):
-                        init_method = next(n for n in node.body if isinstance(n, ast.FunctionDef) and n.name == '__init__')
-
-                        # Check if __init__ only does simple assignments
-                        all_simple_assigns = True
-                        for stmt in init_method.body:
-                            if isinstance(stmt, ast.Assign):
-                                # Check if it's self.attr = param pattern
-                                if not (isinstance(stmt.targets[0], ast.Attribute) and
-                                       isinstance(stmt.targets[0].value, ast.Name) and
-                                       stmt.targets[0].value.id == 'self'):
-                                    all_simple_assigns = False
-                                    break
-                            elif not isinstance(stmt, ast.Expr) or not isinstance(stmt.value, ast.Constant):
-                                # Allow docstrings
-                                all_simple_assigns = False
-                                break
-
-                        if all_simple_assigns and len(init_method.body) > 3:
-                            improvements.append(Improvement.create(
-                                improvement_type=ImprovementType.ARCHITECTURE,
-                                priority=ImprovementPriority.LOW,
-                                target_file=file_path,
-                                target_line=node.lineno,
-                                title=f"Class '{node.name}' could use @dataclass decorator",
-                                description=(
-                                    f"Class '{node.name}' at line {node.lineno} appears to be a simple data container with only __init__. "
-                                    f"Consider using @dataclass decorator which: "
-                                    f"1) Reduces boilerplate code, "
-                                    f"2) Auto-generates __init__, __repr__, __eq__, "
-                                    f"3) Makes intent clearer, "
-                                    f"4) Provides type safety with less code."
-                                ),
-                                proposed_changes=(
-                                    f"Convert class '{node.name}' to use @dataclass decorator"
-                                ),
-                                rationale="Dataclass decorator reduces boilerplate and makes data containers clearer",
-                                impact="low",
-                                effort="trivial",
-                                analyzer_source=self.analyzer_name
-                            ))
+    def _detect_pattern_violations(
+        self, class_facts: list[_ClassFacts], file_path: str
+    ) -> list[Improvement]:
+        """Emit design pattern violations from pre-collected class facts."""
+        improvements = []
 
-        except Exception as e:
-            print(f"Warning: Could not detect pattern violations in {file_path}: {e}")
+        for facts in class_facts:
+            node = facts.node
+
+            public_count = facts.public_method_count
+
+            # God object heuristic: > 10 public methods
+            if public_count > 10:
+                improvements.append(Improvement.create(
+                    improvement_type=ImprovementType.ARCHITECTURE,
+                    priority=ImprovementPriority.HIGH,
+                    target_file=file_path,
+                    target_line=node.lineno,
+                    title=f"God object detected: class '{node.name}' has {public_count} public methods",
+                    description=_GOD_OBJECT_DESCRIPTION.format(
+                        name=node.name, lineno=node.lineno, count=public_count,
+                    ),
+                    proposed_changes=(
+                        f"Decompose God object '{node.name}' into smaller, focused classes (aim for < 10 methods per class)"
+                    ),
+                    rationale="God objects with > 10 public methods are difficult to maintain and violate good OO design",
+                    impact="high",
+                    effort="large",
+                    analyzer_source=self.analyzer_name
+                ))
+
+            # Check for data classes that should use dataclass decorator
+            # Heuristic: class with only __init__ and simple attribute assignments
+            if public_count == 0 and facts.trivial_dataclass_init:
+                improvements.append(Improvement.create(
+                    improvement_type=ImprovementType.ARCHITECTURE,
+                    priority=ImprovementPriority.LOW,
+                    target_file=file_path,
+                    target_line=node.lineno,
+                    title=f"Class '{node.name}' could use @dataclass decorator",
+                    description=_DATACLASS_DESCRIPTION.format(name=node.name, lineno=node.lineno),
+                    proposed_changes=(
+                        f"Convert class '{node.name}' to use @dataclass decorator"
+                    ),
+                    rationale="Dataclass decorator reduces boilerplate and makes data containers clearer",
+                    impact="low",
+                    effort="trivial",
+                    analyzer_source=self.analyzer_name
+                ))
 
         return improvements
 
@@ -312,131 +620,144 @@ class ArchitectureAnalyzer(Analyzer):
         improvements = []
 
         try:
-            # Build import dependency graph
-            import_graph = defaultdict(set)
+            smell_inputs = []
 
             for file_path in files:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        code = f.read()
-                        tree = ast.parse(code, filename=file_path)
+                    # One traversal yields both the imports and class facts
+                    class_facts, imports = _collect_module_facts(self._parse_file(file_path))
+                    smell_inputs.append(
+                        (file_path, self._detect_tight_coupling(class_facts, file_path), imports)
+                    )
 
-                    # Extract module name from file path
-                    module_name = file_path.replace('/', '.').replace('.py', '')
+                except Exception as e:
+                    logger.warning("Could not analyze %s: %s", file_path, e)
+                    continue
 
-                    # Collect imports
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Import):
-                            for alias in node.names:
-                                import_graph[module_name].add(alias.name)
+            improvements.extend(self._combine_smells(smell_inputs))
 
-                        elif isinstance(node, ast.ImportFrom):
-                            if node.module:
-                                import_graph[module_name].add(node.module)
+        except Exception as e:
+            logger.warning("Could not identify architectural smells: %s", e)
 
-                except Exception as e:
-                    print(f"Warning: Could not analyze imports in {file_path}: {e}")
-                    continue
+        return improvements
 
-            # Detect circular dependencies
-            for module, imports in import_graph.items():
-                for imported_module in imports:
-                    # Check if imported module imports this module back
-                    if module in import_graph.get(imported_module, set()):
-                        # Found circular dependency
-                        # Get file paths for both modules
-                        file1 = module.replace('.', '/') + '.py'
-                        file2 = imported_module.replace('.', '/') + '.py'
-
-                        improvements.append(Improvement.create(
-                            improvement_type=ImprovementType.ARCHITECTURE,
-                            priority=ImprovementPriority.HIGH,
-                            target_file=file1,
-                            target_line=None,
-                            title=f"Circular dependency between '{module}' and '{imported_module}'",
-                            description=(
-                                f"Circular dependency detected: '{module}' imports '{imported_module}' and vice versa. "
-                                f"Circular dependencies cause: "
-                                f"1) Import errors or initialization issues, "
-                                f"2) Difficulty understanding module relationships, "
-                                f"3) Impossible to test modules independently, "
-                                f"4) Tight coupling between modules. "
-                                f"Break the cycle by: "
-                                f"1) Moving shared code to a separate module both can import, "
-                                f"2) Using dependency injection instead of direct imports, "
-                                f"3) Introducing an interface/protocol layer, "
-                                f"4) Refactoring to eliminate the cyclic relationship."
-                            ),
-                            proposed_changes=(
-                                f"Break circular dependency between '{module}' and '{imported_module}'"
-                            ),
-                            rationale="Circular dependencies cause import errors and make code difficult to test and maintain",
-                            impact="critical",
-                            effort="medium",
-                            analyzer_source=self.analyzer_name
-                        ))
-
-            # Detect tight coupling (direct instantiation in business logic)
-            for file_path in files:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        code = f.read()
-                        tree = ast.parse(code, filename=file_path)
-
-                    # Look for classes that directly instantiate other classes
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.ClassDef):
-                            # Count direct instantiations within methods
-                            instantiation_count = 0
-
-                            for child in ast.walk(node):
-                                if isinstance(child, ast.Call):
-                                    # Check if it's a class instantiation (not a function call)
-                                    if isinstance(child.func, ast.Name):
-                                        # Heuristic: capitalized names are likely classes
-                                        if child.func.id and child.func.id[0].isupper():
-                                            instantiation_count += 1
-
-                            # If many instantiations, suggest dependency injection
-                            if instantiation_count > 3:
-                                improvements.append(Improvement.create(
-                                    improvement_type=ImprovementType.ARCHITECTURE,
-                                    priority=ImprovementPriority.MEDIUM,
-                                    target_file=file_path,
-                                    target_line=node.lineno,
-                                    title=f"Tight coupling in class '{node.name}' (many direct instantiations)",
-                                    description=(
-                                        f"Class '{node.name}' at line {node.lineno} directly instantiates {instantiation_count} other classes. "
-                                        f"Direct instantiation creates tight coupling because: "
-                                        f"1) Hard to test (can't mock dependencies), "
-                                        f"2) Hard to reuse with different implementations, "
-                                        f"3) Changes to dependencies require changes here. "
-                                        f"Consider using dependency injection: "
-                                        f"1) Pass dependencies via constructor (__init__), "
-                                        f"2) Define interfaces for dependencies, "
-                                        f"3) Use factory pattern for complex object creation, "
-                                        f"4) Configure dependencies externally."
-                                    ),
-                                    proposed_changes=(
-                                        f"Refactor class '{node.name}' to use dependency injection instead of direct instantiation"
-                                    ),
-                                    rationale="Direct instantiation creates tight coupling and makes code difficult to test and reuse",
-                                    impact="medium",
-                                    effort="medium",
-                                    analyzer_source=self.analyzer_name
-                                ))
+    def _combine_smells(
+        self, smell_inputs: list[tuple[str, list[Improvement], set[str]]]
+    ) -> list[Improvement]:
+        """
+        Combine per-file smell inputs into the cross-file smell report.
 
-                except Exception as e:
-                    print(f"Warning: Could not analyze coupling in {file_path}: {e}")
-                    continue
+        Args:
+            smell_inputs: (file path, tight-coupling improvements, imported
+                module names) for each successfully analyzed file
 
-        except Exception as e:
-            print(f"Warning: Could not identify architectural smells: {e}")
+        Returns:
+            Circular dependency improvements followed by tight-coupling ones
+        """
+        # Build import dependency graph
+        import_graph = defaultdict(set)
+        module_to_file: dict[str, str] = {}
+        coupling_improvements = []
+
+        for file_path, file_coupling, imports in smell_inputs:
+            # Extract module name from file path
+            module_name = _file_to_module(file_path)
+            module_to_file.setdefault(module_name, file_path)
+            import_graph[module_name] |= imports
+
+            coupling_improvements.extend(file_coupling)
+
+        return self._detect_circular_dependencies(import_graph, module_to_file) + coupling_improvements
+
+    def _detect_circular_dependencies(
+        self, import_graph: dict[str, set[str]], module_to_file: dict[str, str]
+    ) -> list[Improvement]:
+        """Emit one improvement per import cycle in the module graph."""
+        improvements = []
+
+        # Every strongly connected component with more than one module is a
+        # cycle, reported once
+        for cycle in _find_import_cycles(import_graph):
+            cycle_names = ", ".join(f"'{m}'" for m in cycle[:-1]) + f" and '{cycle[-1]}'"
+
+            improvements.append(Improvement.create(
+                improvement_type=ImprovementType.ARCHITECTURE,
+                priority=ImprovementPriority.HIGH,
+                target_file=module_to_file[cycle[0]],
+                target_line=None,
+                title=f"Circular dependency between {cycle_names}",
+                description=_CIRCULAR_DEPENDENCY_DESCRIPTION.format(modules=cycle_names),
+                proposed_changes=(
+                    f"Break circular dependency between {cycle_names}"
+                ),
+                rationale="Circular dependencies cause import errors and make code difficult to test and maintain",
+                impact="critical",
+                effort="medium",
+                analyzer_source=self.analyzer_name
+            ))
+
+        return improvements
+
+    def _detect_tight_coupling(
+        self, class_facts: list[_ClassFacts], file_path: str
+    ) -> list[Improvement]:
+        """Emit tight-coupling improvements from pre-collected class facts."""
+        improvements = []
+
+        # Detect tight coupling (direct instantiation in business logic)
+        for facts in class_facts:
+            node = facts.node
+            instantiation_count = facts.instantiation_count
+
+            # If many instantiations, suggest dependency injection
+            if instantiation_count > 3:
+                if instantiation_count >= _MAX_TRACKED_INSTANTIATIONS:
+                    count_text = f"{instantiation_count} or more"
+                else:
+                    count_text = str(instantiation_count)
+
+                improvements.append(Improvement.create(
+                    improvement_type=ImprovementType.ARCHITECTURE,
+                    priority=ImprovementPriority.MEDIUM,
+                    target_file=file_path,
+                    target_line=node.lineno,
+                    title=f"Tight coupling in class '{node.name}' (many direct instantiations)",
+                    description=_TIGHT_COUPLING_DESCRIPTION.format(
+                        name=node.name, lineno=node.lineno, count=count_text,
+                    ),
+                    proposed_changes=(
+                        f"Refactor class '{node.name}' to use dependency injection instead of direct instantiation"
+                    ),
+                    rationale="Direct instantiation creates tight coupling and makes code difficult to test and reuse",
+                    impact="medium",
+                    effort="medium",
+                    analyzer_source=self.analyzer_name
+                ))
 
         return improvements
 
     # Helper methods
 
+    def _parse_file(self, file_path: str) -> ast.Module:
+        """
+        Parse a file, reusing the cached tree while the file is unchanged.
+
+        The cache checks the file's mtime and size, so each file is read and
+        parsed at most once per analyze() call and not at all on re-analysis
+        of unchanged artifacts.
+
+        Args:
+            file_path: Path to the Python source file
+
+        Returns:
+            Parsed module AST
+
+        Raises:
+            OSError: If the file cannot be read
+            SyntaxError: If the file is not valid Python
+        """
+        return self._ast_cache.load(file_path, _parse_source)
+
     def _identify_concerns(self, methods: list[str]) -> list[str]:
         """
         Identify distinct concerns/responsibilities based on method names.
@@ -451,21 +772,16 @@ class ArchitectureAnalyzer(Analyzer):
         """
         concerns = set()
 
-        # Common concern patterns
-        patterns = {
-            'data': ['get_', 'set_', 'load_', 'save_', 'read_', 'write_'],
-            'validation': ['validate_', 'check_', 'verify_', 'is_valid'],
-            'formatting': ['format_', 'to_', 'as_', 'render_'],
-            'calculation': ['calculate_', 'compute_', 'sum_', 'count_'],
-            'network': ['fetch_', 'send_', 'request_', 'download_', 'upload_'],
-            'ui': ['display_', 'show_', 'render_', 'draw_'],
-            'persistence': ['save_', 'load_', 'store_', 'retrieve_', 'delete_'],
-        }
-
+        # Walk the prefix trie once per method; the first terminal reached
+        # is the method's concern
         for method in methods:
-            method_lower = method.lower()
-            for concern, prefixes in patterns.items():
-                if any(method_lower.startswith(prefix) for prefix in prefixes):
+            node = _CONCERN_TRIE
+            for ch in method.lower():
+                node = node.get(ch)
+                if node is None:
+                    break
+                concern = node.get('$')
+                if concern is not None:
                     concerns.add(concern)
                     break
 
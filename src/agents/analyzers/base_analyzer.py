@@ -5,12 +5,22 @@ All analyzer modules must inherit from the Analyzer abstract base class
 and implement the analyze() method and analyzer_name property.
 """
 
+import ast
+import os
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+from .models import Improvement, ImprovementPriority
 
 if TYPE_CHECKING:
     from ...models import Task
-    from .models import Improvement
+
+# Files whose parsed trees (or facts derived from them) an analyzer keeps
+# between runs; the least recently used file is dropped first
+_FILE_CACHE_SIZE = 256
+
+_T = TypeVar('_T')
 
 
 class Analyzer(ABC):
@@ -57,3 +67,145 @@ class Analyzer(ABC):
             Analyzer name (e.g., "performance", "code_quality", "testing")
         """
         pass
+
+
+class _FileCache:
+    """
+    Values derived from file contents, keyed by path and bounded in size.
+
+    Analyzers live as long as EverThinker and re-analyze files as they are
+    edited. An entry read from disk remembers the file's mtime and size and
+    is reused while both are unchanged; a new version of a file replaces
+    the old one, and past _FILE_CACHE_SIZE files the least recently used
+    is dropped.
+    """
+
+    def __init__(self):
+        # Path -> (mtime_ns, size, value), least recently used first. The
+        # stat fields are None for values stored without reading the file
+        self._entries: OrderedDict[str, tuple[int | None, int | None, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def load(self, file_path: str, loader: Callable[[bytes, str], _T]) -> _T:
+        """
+        Return the value for a file, reading and loading it only if it changed.
+
+        Args:
+            file_path: Path to the source file
+            loader: Builds the value from the file's raw bytes and its path
+
+        Returns:
+            The cached or newly loaded value
+
+        Raises:
+            OSError: If the file cannot be read
+            Whatever loader raises, e.g. SyntaxError; nothing is cached then
+        """
+        st = os.stat(file_path)
+        value = self.lookup(file_path, st)
+        if value is None:
+            with open(file_path, 'rb') as f:
+                source = f.read()
+            value = loader(source, file_path)
+            self.store(file_path, value, st)
+        return value
+
+    def lookup(self, file_path: str, st: os.stat_result | None = None) -> Any:
+        """
+        Return the cached value for a file, or None.
+
+        With st, only a value read from the file at that mtime and size is
+        returned.
+        """
+        entry = self._entries.get(file_path)
+        if entry is None:
+            return None
+        if st is not None and (entry[0] != st.st_mtime_ns or entry[1] != st.st_size):
+            return None
+        self._entries.move_to_end(file_path)
+        return entry[2]
+
+    def store(self, file_path: str, value: Any, st: os.stat_result | None = None) -> None:
+        """Cache a value for a file, replacing any earlier version of it."""
+        if st is None:
+            self._entries[file_path] = (None, None, value)
+        else:
+            self._entries[file_path] = (st.st_mtime_ns, st.st_size, value)
+        self._entries.move_to_end(file_path)
+        if len(self._entries) > _FILE_CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+
+def _parse_source(source: bytes, file_path: str) -> ast.Module:
+    """
+    Parse raw file bytes; a _FileCache.load() loader.
+
+    The parser honours the file's encoding declaration itself, so no
+    separate text decode is needed.
+    """
+    return ast.parse(source, filename=file_path)
+
+
+class _DispatchVisitor(ast.NodeVisitor):
+    """
+    NodeVisitor that dispatches on a node's exact type through a table.
+
+    Subclasses pass their node type -> handler table to __init__. Looking
+    handlers up by exact type avoids NodeVisitor's per-node
+    getattr('visit_' + class name) lookup; trees come from ast.parse, which
+    never produces subclasses of the ast node classes. Nodes without a
+    handler go to generic_visit, which reads _fields directly instead of
+    going through ast.iter_fields().
+    """
+
+    def __init__(self, dispatch: dict[type[ast.AST], Callable[[ast.AST], None]]):
+        self._dispatch = dispatch
+
+    def visit(self, node: ast.AST):
+        handler = self._dispatch.get(type(node))
+        if handler is not None:
+            handler(node)
+        else:
+            self.generic_visit(node)
+
+    def generic_visit(self, node: ast.AST):
+        visit = self.visit
+        AST = ast.AST
+        for field_name in node._fields:
+            value = getattr(node, field_name, None)
+            if type(value) is list:
+                for item in value:
+                    if isinstance(item, AST):
+                        visit(item)
+            elif isinstance(value, AST):
+                visit(value)
+
+
+def _order_by_priority(improvements: list[Improvement]) -> list[Improvement]:
+    """
+    Order improvements HIGH → MEDIUM → LOW, keeping detection order within each.
+
+    With only three priority values a stable bucket partition does the job
+    of a sort in one pass.
+
+    Args:
+        improvements: Improvements in detection order
+
+    Returns:
+        New list of the same improvements ordered by priority
+    """
+    high, medium, low = [], [], []
+    buckets = {
+        ImprovementPriority.HIGH: high,
+        ImprovementPriority.MEDIUM: medium,
+        ImprovementPriority.LOW: low,
+    }
+    for imp in improvements:
+        buckets[imp.priority].append(imp)
+
+    return high + medium + low
@@ -10,15 +10,311 @@ in generated code, including:
 """
 
 import ast
-from typing import TYPE_CHECKING
-from collections import defaultdict
-
-from .base_analyzer import Analyzer
+import io
+import logging
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
+from collections import defaultdict, deque
+
+from .base_analyzer import Analyzer, _DispatchVisitor, _FileCache, _order_by_priority
 from .models import Improvement, ImprovementType, ImprovementPriority
 
 if TYPE_CHECKING:
     from ...models import Task
 
+logger = logging.getLogger(__name__)
+
+
+# Polynomial rolling hash over per-line hashes for duplicate block detection;
+# the modulus is the Mersenne prime 2**61 - 1
+_BLOCK_HASH_BASE = 1000003
+_BLOCK_HASH_MOD = (1 << 61) - 1
+
+# Files longer than this (typically generated code) are reported for manual
+# review instead of being parsed and scanned for duplication
+_MAX_ANALYZABLE_LINES = 5000
+
+
+# Decision points each node type adds to cyclomatic complexity: conditionals,
+# loops, exception handlers, context managers, asserts and comprehensions.
+# Boolean operators and comprehension `if` clauses are counted separately
+_DECISION_POINTS = {
+    ast.If: 1,
+    ast.While: 1,
+    ast.For: 1,
+    ast.AsyncFor: 1,
+    ast.ExceptHandler: 1,
+    ast.With: 1,
+    ast.AsyncWith: 1,
+    ast.Assert: 1,
+    ast.ListComp: 1,
+    ast.DictComp: 1,
+    ast.SetComp: 1,
+    ast.GeneratorExp: 1,
+}
+
+# Node types with no child nodes that matter to any detector: expression
+# contexts, operators, constants and bare statements. The visitor skips them
+# instead of paying a visit() call for each
+_LEAF_NODE_TYPES = frozenset(
+    node_type
+    for base in (ast.expr_context, ast.operator, ast.boolop, ast.unaryop, ast.cmpop)
+    for node_type in base.__subclasses__()
+) | {ast.Constant, ast.Pass, ast.Break, ast.Continue, ast.Global, ast.Nonlocal}
+
+# Improvement description text; only the per-finding values vary
+_SEVERE_COMPLEXITY_DESCRIPTION = (
+    "Function '{name}' at line {lineno} has cyclomatic complexity of {complexity}, "
+    "which is considered very high (threshold: 15). "
+    "High complexity makes code difficult to understand, test, and maintain. "
+    "Consider: 1) Breaking function into smaller, focused functions, "
+    "2) Extracting complex conditionals into named helper functions, "
+    "3) Using polymorphism or strategy pattern to reduce branching, "
+    "4) Simplifying boolean logic with early returns."
+)
+
+_HIGH_COMPLEXITY_DESCRIPTION = (
+    "Function '{name}' at line {lineno} has cyclomatic complexity of {complexity}. "
+    "Complexity above 10 suggests the function is doing too much. "
+    "Consider: 1) Extracting helper functions for distinct responsibilities, "
+    "2) Simplifying nested conditionals, "
+    "3) Using guard clauses to reduce nesting, "
+    "4) Applying the Single Responsibility Principle."
+)
+
+_DUPLICATION_DESCRIPTION = (
+    "Found {line_count} lines of duplicated code appearing in {count} locations: {locations}. "
+    "Code duplication violates the DRY (Don't Repeat Yourself) principle and makes maintenance harder. "
+    "When fixing bugs or making changes, all duplicated locations must be updated consistently. "
+    "Consider: 1) Extracting common code into a shared function, "
+    "2) Creating a utility module for reusable logic, "
+    "3) Using inheritance or composition to share behavior."
+)
+
+_LONG_METHOD_DESCRIPTION = (
+    "Function '{name}' at line {lineno} is {length} lines long, "
+    "exceeding the recommended 50-line guideline. "
+    "Long functions are harder to understand, test, and maintain. "
+    "They often indicate the function is doing too much (violating Single Responsibility Principle). "
+    "Consider: 1) Breaking into smaller, focused functions, "
+    "2) Extracting logical sections into helper methods, "
+    "3) Identifying and separating distinct responsibilities."
+)
+
+_UNUSED_IMPORT_DESCRIPTION = (
+    "Import '{full_name}' at line {lineno} is never used. "
+    "Unused imports clutter the code and can: "
+    "1) Slow down module loading, "
+    "2) Cause confusion about dependencies, "
+    "3) Hide actual import errors. "
+    "Remove unused imports to keep code clean."
+)
+
+_UNUSED_VARIABLE_DESCRIPTION = (
+    "Variable '{var}' is assigned but never used in function '{name}'. "
+    "Unused variables can: "
+    "1) Indicate incomplete code, "
+    "2) Cause confusion about intent, "
+    "3) Waste memory. "
+    "Either use the variable or remove it. If intentionally unused, prefix with '_'."
+)
+
+_FILE_TOO_LARGE_DESCRIPTION = (
+    "File '{file_path}' has {line_count} lines, more than the {limit} lines analyzed automatically. "
+    "Complexity, long method, dead code and duplication checks were skipped for this file. "
+    "Files this large are often generated; if it is hand-written, consider splitting it into smaller modules."
+)
+
+
+def _count_lines(code: str) -> int:
+    """
+    Count the lines of source code, a last line without a newline included.
+
+    This is the number of the file's last line, so it is the measure every
+    _MAX_ANALYZABLE_LINES check uses.
+    """
+    return code.count('\n') + (bool(code) and not code.endswith('\n'))
+
+
+def _load_source(source: bytes, file_path: str) -> tuple[str, ast.Module | None]:
+    """
+    Decode and parse raw file bytes; a _FileCache.load() loader.
+
+    The bytes are decoded as UTF-8 with universal newlines, as reading the
+    file in text mode would. Files over _MAX_ANALYZABLE_LINES are not
+    parsed; their tree is None.
+    """
+    code = io.TextIOWrapper(io.BytesIO(source), encoding='utf-8').read()
+    if _count_lines(code) > _MAX_ANALYZABLE_LINES:
+        return code, None
+    return code, ast.parse(code, filename=file_path)
+
+
+class _FileTooLarge(Exception):
+    """Raised by _normalized_lines() past _MAX_ANALYZABLE_LINES lines."""
+
+
+def _normalized_lines(lines: Iterable[str]):
+    """
+    Yield (normalized text, line number) for each code line, reading lazily.
+
+    Blank and comment-only lines are skipped. Text is stripped and interned,
+    sharing one object (and its cached hash) between repeated lines across
+    all files.
+
+    Raises:
+        _FileTooLarge: On reaching line _MAX_ANALYZABLE_LINES + 1; lines are
+            counted as _count_lines() counts them, blank and comment lines
+            included
+    """
+    for i, line in enumerate(lines, start=1):
+        if i > _MAX_ANALYZABLE_LINES:
+            raise _FileTooLarge
+        stripped = line.strip()
+        if stripped and not stripped.startswith('#'):
+            yield sys.intern(stripped), i
+
+
+@dataclass
+class _FunctionFacts:
+    """Facts about one function, gathered in a single traversal of its module."""
+    node: ast.FunctionDef | ast.AsyncFunctionDef
+    # Cyclomatic complexity: decision points + 1
+    complexity: int = 1
+    # Names assigned with `name = ...` and names loaded, anywhere in the body
+    assigned_vars: set[str] = field(default_factory=set)
+    used_vars: set[str] = field(default_factory=set)
+
+
+@dataclass
+class _ModuleFacts:
+    """Everything the per-file detectors need from one module."""
+    functions: list[_FunctionFacts] = field(default_factory=list)
+    # Imported name -> (line, full dotted name)
+    imports: dict[str, tuple[int, str]] = field(default_factory=dict)
+    # Names referenced anywhere, including `module` in `module.attr`
+    names_used: set[str] = field(default_factory=set)
+
+
+class _QualityFactsVisitor(_DispatchVisitor):
+    """
+    Walk a module once and collect _ModuleFacts for it.
+
+    A function context stack attributes decision points to the innermost
+    function only, so nested functions and lambdas do not inflate their
+    enclosing function's complexity. Assignments and loads are credited to
+    every enclosing function, since closures read outer variables.
+
+    Node types are matched exactly (dispatch tables and `type(x) is` checks)
+    rather than with isinstance; trees come from ast.parse, which never
+    produces subclasses of the ast node classes.
+    """
+
+    def __init__(self):
+        self.facts = _ModuleFacts()
+        self._function_stack: list[_FunctionFacts] = []
+        # Handlers for nodes that record more than their flat
+        # decision-point count
+        super().__init__({
+            ast.FunctionDef: self._visit_function,
+            ast.AsyncFunctionDef: self._visit_function,
+            ast.Lambda: self._visit_lambda,
+            ast.BoolOp: self._visit_bool_op,
+            ast.ListComp: self._visit_comprehension,
+            ast.DictComp: self._visit_comprehension,
+            ast.SetComp: self._visit_comprehension,
+            ast.GeneratorExp: self._visit_comprehension,
+            ast.Import: self._visit_import,
+            ast.ImportFrom: self._visit_import_from,
+            ast.Assign: self._visit_assign,
+            ast.Name: self._visit_name,
+        })
+
+    def visit(self, node: ast.AST):
+        decision_points = _DECISION_POINTS.get(type(node))
+        if decision_points is not None:
+            self._add_decision_points(decision_points)
+        super().visit(node)
+
+    def generic_visit(self, node: ast.AST):
+        visit = self.visit
+        AST = ast.AST
+        leaf_types = _LEAF_NODE_TYPES
+        for field_name in node._fields:
+            value = getattr(node, field_name, None)
+            if type(value) is list:
+                for item in value:
+                    if isinstance(item, AST) and type(item) not in leaf_types:
+                        visit(item)
+            elif isinstance(value, AST) and type(value) not in leaf_types:
+                visit(value)
+
+    def _add_decision_points(self, count: int):
+        if self._function_stack:
+            self._function_stack[-1].complexity += count
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef):
+        facts = _FunctionFacts(node=node)
+        self.facts.functions.append(facts)
+        self._function_stack.append(facts)
+        self.generic_visit(node)
+        self._function_stack.pop()
+
+    def _visit_lambda(self, node: ast.Lambda):
+        # Lambdas are not reported on, but still get their own frame so
+        # their branches are not charged to the enclosing function
+        self._function_stack.append(_FunctionFacts(node=node))
+        self.generic_visit(node)
+        self._function_stack.pop()
+
+    def _visit_bool_op(self, node: ast.BoolOp):
+        # and/or operator - count number of operands - 1
+        self._add_decision_points(len(node.values) - 1)
+        self.generic_visit(node)
+
+    def _visit_comprehension(self, node: ast.AST):
+        # The iteration itself is counted via _DECISION_POINTS; each `if`
+        # clause adds one more
+        ifs = sum(len(gen.ifs) for gen in node.generators)
+        if ifs:
+            self._add_decision_points(ifs)
+        self.generic_visit(node)
+
+    def _visit_import(self, node: ast.Import):
+        for alias in node.names:
+            name = alias.asname if alias.asname else alias.name
+            self.facts.imports[name] = (node.lineno, alias.name)
+
+    def _visit_import_from(self, node: ast.ImportFrom):
+        for alias in node.names:
+            name = alias.asname if alias.asname else alias.name
+            self.facts.imports[name] = (node.lineno, f"{node.module}.{alias.name}")
+
+    def _visit_assign(self, node: ast.Assign):
+        for target in node.targets:
+            if type(target) is ast.Name:
+                for facts in self._function_stack:
+                    facts.assigned_vars.add(target.id)
+        self.generic_visit(node)
+
+    def _visit_name(self, node: ast.Name):
+        # Every Name counts as a reference; this includes the module in
+        # `module.function` attribute access
+        self.facts.names_used.add(node.id)
+        # Track usage (loads, not stores)
+        if type(node.ctx) is ast.Load:
+            for facts in self._function_stack:
+                facts.used_vars.add(node.id)
+
+
+def _collect_quality_facts(node: ast.AST) -> _ModuleFacts:
+    """Return facts for a module (or a single function) using one traversal."""
+    visitor = _QualityFactsVisitor()
+    visitor.visit(node)
+    return visitor.facts
+
 
 class CodeQualityAnalyzer(Analyzer):
     """
@@ -29,6 +325,11 @@ class CodeQualityAnalyzer(Analyzer):
     and dead code detection.
     """
 
+    def __init__(self):
+        # (source, tree) for the latest version of each file; the tree is
+        # None for files over _MAX_ANALYZABLE_LINES
+        self._file_cache = _FileCache()
+
     @property
     def analyzer_name(self) -> str:
         """Return analyzer name."""
@@ -52,40 +353,44 @@ class CodeQualityAnalyzer(Analyzer):
         if not python_files:
             return improvements
 
-        # Run all detection methods
         for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    code = f.read()
+            improvements.extend(self._analyze_file(file_path))
 
-                # Complexity analysis
-                improvements.extend(self._analyze_complexity(code, file_path))
+        # Code duplication across all files
+        improvements.extend(self.detect_duplication(python_files))
 
-                # Long methods
-                improvements.extend(self.find_long_methods(code, file_path))
+        # Order by priority: HIGH → MEDIUM → LOW
+        return _order_by_priority(improvements)
 
-                # Dead code
-                improvements.extend(self.detect_dead_code(code, file_path))
+    def _analyze_file(self, file_path: str) -> list[Improvement]:
+        """
+        Run the per-file detectors (complexity, long methods, dead code).
 
-            except SyntaxError as e:
-                print(f"Warning: Syntax error in {file_path}: {e}")
-                continue
-            except Exception as e:
-                print(f"Warning: Could not analyze {file_path}: {e}")
-                continue
+        Args:
+            file_path: Path to the Python file
 
-        # Detect code duplication across all files
-        improvements.extend(self.detect_duplication(python_files))
+        Returns:
+            Improvements for the file; empty if it cannot be read or parsed
+        """
+        try:
+            code, tree = self._parse_file(file_path)
+            if tree is None:
+                return [self._file_too_large(file_path, code)]
 
-        # Sort by priority: HIGH → MEDIUM → LOW
-        priority_order = {
-            ImprovementPriority.HIGH: 0,
-            ImprovementPriority.MEDIUM: 1,
-            ImprovementPriority.LOW: 2,
-        }
-        improvements.sort(key=lambda imp: priority_order[imp.priority])
+            # Traverse once; every detector reads the same facts
+            facts = _collect_quality_facts(tree)
 
-        return improvements
+            improvements = self._check_complexity(facts, file_path)
+            improvements.extend(self._find_long_methods(facts, file_path))
+            improvements.extend(self._detect_dead_code(facts, file_path))
+            return improvements
+
+        except SyntaxError as e:
+            logger.warning("Syntax error in %s: %s", file_path, e)
+            return []
+        except Exception as e:
+            logger.warning("Could not analyze %s: %s", file_path, e)
+            return []
 
     def calculate_complexity(self, function_node: ast.FunctionDef) -> int:
         """
@@ -93,6 +398,8 @@ class CodeQualityAnalyzer(Analyzer):
 
         Cyclomatic complexity = number of decision points + 1
         Decision points: if, while, for, and, or, except, with, assert, comprehensions
+        Nested functions and lambdas are scored separately and do not add to
+        the enclosing function's complexity.
 
         Args:
             function_node: AST FunctionDef node
@@ -100,39 +407,7 @@ class CodeQualityAnalyzer(Analyzer):
         Returns:
             Cyclomatic complexity value (minimum 1)
         """
-        complexity = 1  # Base complexity
-
-        for node in ast.walk(function_node):
-            # Conditional statements
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.AsyncFor)):
-                complexity += 1
-
-            # Boolean operators (each 'and'/'or' is a decision point)
-            elif isinstance(node, ast.BoolOp):
-                # and/or operator - count number of operands - 1
-                complexity += len(node.values) - 1
-
-            # Exception handlers
-            elif isinstance(node, ast.ExceptHandler):
-                complexity += 1
-
-            # Comprehensions (list, dict, set, generator)
-            elif isinstance(node, (ast.ListComp, ast.DictComp, ast.SetComp, ast.GeneratorExp)):
-                # Each comprehension adds complexity for the iteration
-                complexity += 1
-                # Count if clauses in comprehensions
-                for generator in node.generators:
-                    complexity += len(generator.ifs)
-
-            # With statements (context managers)
-            elif isinstance(node, (ast.With, ast.AsyncWith)):
-                complexity += 1
-
-            # Assert statements
-            elif isinstance(node, ast.Assert):
-                complexity += 1
-
-        return complexity
+        return _collect_quality_facts(function_node).functions[0].complexity
 
     def _analyze_complexity(self, code: str, file_path: str) -> list[Improvement]:
         """
@@ -145,68 +420,83 @@ class CodeQualityAnalyzer(Analyzer):
         Returns:
             List of improvements for high complexity functions
         """
-        improvements = []
+        if _count_lines(code) > _MAX_ANALYZABLE_LINES:
+            return [self._file_too_large(file_path, code)]
 
         try:
-            tree = ast.parse(code, filename=file_path)
-
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    complexity = self.calculate_complexity(node)
-
-                    if complexity > 15:
-                        # Severe complexity - HIGH priority
-                        improvements.append(Improvement.create(
-                            improvement_type=ImprovementType.CODE_QUALITY,
-                            priority=ImprovementPriority.HIGH,
-                            target_file=file_path,
-                            target_line=node.lineno,
-                            title=f"Severe cyclomatic complexity in function '{node.name}' (complexity: {complexity})",
-                            description=(
-                                f"Function '{node.name}' at line {node.lineno} has cyclomatic complexity of {complexity}, "
-                                f"which is considered very high (threshold: 15). "
-                                f"High complexity makes code difficult to understand, test, and maintain. "
-                                f"Consider: 1) Breaking function into smaller, focused functions, "
-                                f"2) Extracting complex conditionals into named helper functions, "
-                                f"3) Using polymorphism or strategy pattern to reduce branching, "
-                                f"4) Simplifying boolean logic with early returns."
-                            ),
-                            proposed_changes=(
-                                f"Refactor function '{node.name}' to reduce complexity from {complexity} to < 10"
-                            ),
-                            rationale="Functions with complexity > 15 are difficult to understand and test, leading to maintenance issues",
-                            impact="high",
-                            effort="medium",
-                            analyzer_source=self.analyzer_name
-                        ))
-
-                    elif complexity > 10:
-                        # Moderate complexity - MEDIUM priority
-                        improvements.append(Improvement.create(
-                            improvement_type=ImprovementType.CODE_QUALITY,
-                            priority=ImprovementPriority.MEDIUM,
-                            target_file=file_path,
-                            target_line=node.lineno,
-                            title=f"High cyclomatic complexity in function '{node.name}' (complexity: {complexity})",
-                            description=(
-                                f"Function '{node.name}' at line {node.lineno} has cyclomatic complexity of {complexity}. "
-                                f"Complexity above 10 suggests the function is doing too much. "
-                                f"Consider: 1) Extracting helper functions for distinct responsibilities, "
-                                f"2) Simplifying nested conditionals, "
-                                f"3) Using guard clauses to reduce nesting, "
-                                f"4) Applying the Single Responsibility Principle."
-                            ),
-                            proposed_changes=(
-                                f"Refactor function '{node.name}' to reduce complexity from {complexity} to ≤ 10"
-                            ),
-                            rationale="Complexity > 10 indicates code that is harder to maintain and test effectively",
-                            impact="medium",
-                            effort="small",
-                            analyzer_source=self.analyzer_name
-                        ))
-
+            tree = self._parse_ast(code, file_path)
+            return self._check_complexity(_collect_quality_facts(tree), file_path)
         except Exception as e:
-            print(f"Warning: Could not analyze complexity in {file_path}: {e}")
+            logger.warning("Could not analyze complexity in %s: %s", file_path, e)
+            return []
+
+    def _file_too_large(self, file_path: str, code: str) -> Improvement:
+        """Report a file that exceeds _MAX_ANALYZABLE_LINES for manual review."""
+        line_count = _count_lines(code)
+        return Improvement.create(
+            improvement_type=ImprovementType.CODE_QUALITY,
+            priority=ImprovementPriority.LOW,
+            target_file=file_path,
+            title=f"File too large for automated analysis ({line_count} lines)",
+            description=_FILE_TOO_LARGE_DESCRIPTION.format(
+                file_path=file_path, line_count=line_count, limit=_MAX_ANALYZABLE_LINES,
+            ),
+            proposed_changes=(
+                f"Review '{file_path}' manually or split it into smaller modules"
+            ),
+            rationale="Very large files dominate analysis time and are usually generated code",
+            impact="low",
+            effort="medium",
+            analyzer_source=self.analyzer_name
+        )
+
+    def _check_complexity(self, facts: _ModuleFacts, file_path: str) -> list[Improvement]:
+        """Emit complexity improvements from pre-collected module facts."""
+        improvements = []
+
+        for func in facts.functions:
+            node = func.node
+            complexity = func.complexity
+
+            if complexity > 15:
+                # Severe complexity - HIGH priority
+                improvements.append(Improvement.create(
+                    improvement_type=ImprovementType.CODE_QUALITY,
+                    priority=ImprovementPriority.HIGH,
+                    target_file=file_path,
+                    target_line=node.lineno,
+                    title=f"Severe cyclomatic complexity in function '{node.name}' (complexity: {complexity})",
+                    description=_SEVERE_COMPLEXITY_DESCRIPTION.format(
+                        name=node.name, lineno=node.lineno, complexity=complexity,
+                    ),
+                    proposed_changes=(
+                        f"Refactor function '{node.name}' to reduce complexity from {complexity} to < 10"
+                    ),
+                    rationale="Functions with complexity > 15 are difficult to understand and test, leading to maintenance issues",
+                    impact="high",
+                    effort="medium",
+                    analyzer_source=self.analyzer_name
+                ))
+
+            elif complexity > 10:
+                # Moderate complexity - MEDIUM priority
+                improvements.append(Improvement.create(
+                    improvement_type=ImprovementType.CODE_QUALITY,
+                    priority=ImprovementPriority.MEDIUM,
+                    target_file=file_path,
+                    target_line=node.lineno,
+                    title=f"High cyclomatic complexity in function '{node.name}' (complexity: {complexity})",
+                    description=_HIGH_COMPLEXITY_DESCRIPTION.format(
+                        name=node.name, lineno=node.lineno, complexity=complexity,
+                    ),
+                    proposed_changes=(
+                        f"Refactor function '{node.name}' to reduce complexity from {complexity} to ≤ 10"
+                    ),
+                    rationale="Complexity > 10 indicates code that is harder to maintain and test effectively",
+                    impact="medium",
+                    effort="small",
+                    analyzer_source=self.analyzer_name
+                ))
 
         return improvements
 
@@ -215,6 +505,8 @@ class CodeQualityAnalyzer(Analyzer):
         Detect code duplication across files by comparing code blocks.
 
         Looks for duplicate sequences of 6+ lines (ignoring whitespace and comments).
+        Files longer than _MAX_ANALYZABLE_LINES are skipped; analyze() reports
+        them for manual review.
 
         Args:
             files: List of Python file paths to analyze
@@ -224,43 +516,91 @@ class CodeQualityAnalyzer(Analyzer):
         """
         improvements = []
 
-        # Build a map of normalized code blocks to (file, line) locations
+        # Map rolling-hash fingerprints of normalized code blocks to the
+        # (file index, window index) of every block with that fingerprint
         block_map = defaultdict(list)
         min_block_size = 6  # Minimum lines to consider duplication
+        file_lines: list[list[tuple[str, int]]] = []
+        too_large: set[int] = set()
 
-        for file_path in files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-
-                # Extract normalized code blocks (skip blank lines and comments)
-                normalized_lines = []
-                for i, line in enumerate(lines, start=1):
-                    stripped = line.strip()
-                    # Skip empty lines and comment-only lines
-                    if stripped and not stripped.startswith('#'):
-                        # Normalize: remove leading/trailing whitespace but preserve structure
-                        normalized_lines.append((stripped, i))
-
-                # Generate sliding windows of min_block_size
-                for i in range(len(normalized_lines) - min_block_size + 1):
-                    block = normalized_lines[i:i + min_block_size]
-                    block_text = '\n'.join(line[0] for line in block)
-                    start_line = block[0][1]
-
-                    # Store location of this block
-                    block_map[block_text].append((file_path, start_line))
+        # Weight of the line leaving the window when it slides by one
+        leading_weight = pow(_BLOCK_HASH_BASE, min_block_size - 1, _BLOCK_HASH_MOD)
 
+        for file_index, file_path in enumerate(files):
+            normalized_lines = []
+            file_lines.append(normalized_lines)
+            try:
+                # Reuse the source analyze() has just read while the file is
+                # unchanged; otherwise stream it from disk
+                cached = self._file_cache.lookup(file_path, os.stat(file_path))
+                if cached is None:
+                    source = open(file_path, 'r', encoding='utf-8')
+                elif cached[1] is None:
+                    # Over _MAX_ANALYZABLE_LINES; analyze() reports it
+                    continue
+                else:
+                    source = io.StringIO(cached[0])
+
+                with source:
+                    # Slide a window of min_block_size lines as they are read,
+                    # updating a polynomial hash of the per-line hashes in
+                    # O(1) per step. Each file's normalized code lines are
+                    # kept to confirm candidate blocks
+                    window = deque(maxlen=min_block_size)
+                    fingerprint = 0
+                    lines = _normalized_lines(source)
+
+                    # Fingerprint the first block; shorter files cannot duplicate
+                    for item in lines:
+                        normalized_lines.append(item)
+                        h = hash(item[0]) % _BLOCK_HASH_MOD
+                        window.append(h)
+                        fingerprint = (fingerprint * _BLOCK_HASH_BASE + h) % _BLOCK_HASH_MOD
+                        if len(window) == min_block_size:
+                            break
+                    else:
+                        continue
+
+                    block_map[fingerprint].append((file_index, 0))
+
+                    # Each further line drops the window's oldest line hash
+                    for i, item in enumerate(lines, start=1):
+                        normalized_lines.append(item)
+                        h = hash(item[0]) % _BLOCK_HASH_MOD
+                        fingerprint = (
+                            (fingerprint - window[0] * leading_weight) * _BLOCK_HASH_BASE + h
+                        ) % _BLOCK_HASH_MOD
+                        window.append(h)
+                        block_map[fingerprint].append((file_index, i))
+
+            except _FileTooLarge:
+                too_large.add(file_index)
+                normalized_lines.clear()
+                continue
             except Exception as e:
-                print(f"Warning: Could not analyze duplication in {file_path}: {e}")
+                logger.warning("Could not analyze duplication in %s: %s", file_path, e)
                 continue
 
         # Find duplicates
-        for block_text, locations in block_map.items():
-            if len(locations) >= 2:
+        for candidates in block_map.values():
+            if len(candidates) < 2:
+                continue
+
+            # Confirm by comparing the lines themselves, since distinct blocks
+            # can share a fingerprint; text is only rebuilt for these groups
+            blocks = defaultdict(list)
+            for file_index, i in candidates:
+                if file_index in too_large:
+                    continue
+                block = file_lines[file_index][i:i + min_block_size]
+                blocks[tuple(text for text, _ in block)].append((files[file_index], block[0][1]))
+
+            for block_lines, locations in blocks.items():
+                if len(locations) < 2:
+                    continue
+
                 # Found duplication
-                # Count actual lines (may be more than min_block_size)
-                line_count = len(block_text.split('\n'))
+                line_count = len(block_lines)
 
                 # Build description of all locations
                 location_desc = ', '.join(
@@ -287,13 +627,8 @@ class CodeQualityAnalyzer(Analyzer):
                     target_file=target_file,
                     target_line=target_line,
                     title=f"Code duplication detected ({line_count} lines duplicated {len(locations)} times)",
-                    description=(
-                        f"Found {line_count} lines of duplicated code appearing in {len(locations)} locations: {location_desc}. "
-                        f"Code duplication violates the DRY (Don't Repeat Yourself) principle and makes maintenance harder. "
-                        f"When fixing bugs or making changes, all duplicated locations must be updated consistently. "
-                        f"Consider: 1) Extracting common code into a shared function, "
-                        f"2) Creating a utility module for reusable logic, "
-                        f"3) Using inheritance or composition to share behavior."
+                    description=_DUPLICATION_DESCRIPTION.format(
+                        line_count=line_count, count=len(locations), locations=location_desc,
                     ),
                     proposed_changes=(
                         f"Extract duplicated code into a shared function or module"
@@ -317,49 +652,39 @@ class CodeQualityAnalyzer(Analyzer):
         Returns:
             List of improvements for long methods
         """
+        try:
+            tree = self._parse_ast(code, file_path)
+            return self._find_long_methods(_collect_quality_facts(tree), file_path)
+        except Exception as e:
+            logger.warning("Could not analyze method lengths in %s: %s", file_path, e)
+            return []
+
+    def _find_long_methods(self, facts: _ModuleFacts, file_path: str) -> list[Improvement]:
+        """Emit long-method improvements from pre-collected module facts."""
         improvements = []
 
-        try:
-            tree = ast.parse(code, filename=file_path)
-            lines = code.split('\n')
-
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    # Calculate function length
-                    # Note: AST provides line numbers, end_lineno available in Python 3.8+
-                    if hasattr(node, 'end_lineno') and node.end_lineno:
-                        func_length = node.end_lineno - node.lineno + 1
-                    else:
-                        # Fallback: estimate by finding next def or end of file
-                        func_length = self._estimate_function_length(node, lines)
-
-                    if func_length > 50:
-                        improvements.append(Improvement.create(
-                            improvement_type=ImprovementType.CODE_QUALITY,
-                            priority=ImprovementPriority.MEDIUM,
-                            target_file=file_path,
-                            target_line=node.lineno,
-                            title=f"Long method '{node.name}' ({func_length} lines)",
-                            description=(
-                                f"Function '{node.name}' at line {node.lineno} is {func_length} lines long, "
-                                f"exceeding the recommended 50-line guideline. "
-                                f"Long functions are harder to understand, test, and maintain. "
-                                f"They often indicate the function is doing too much (violating Single Responsibility Principle). "
-                                f"Consider: 1) Breaking into smaller, focused functions, "
-                                f"2) Extracting logical sections into helper methods, "
-                                f"3) Identifying and separating distinct responsibilities."
-                            ),
-                            proposed_changes=(
-                                f"Refactor function '{node.name}' into smaller, focused functions"
-                            ),
-                            rationale="Functions > 50 lines are typically doing too much and should be decomposed",
-                            impact="medium",
-                            effort="medium",
-                            analyzer_source=self.analyzer_name
-                        ))
+        for func in facts.functions:
+            node = func.node
+            func_length = node.end_lineno - node.lineno + 1
 
-        except Exception as e:
-            print(f"Warning: Could not analyze method lengths in {file_path}: {e}")
+            if func_length > 50:
+                improvements.append(Improvement.create(
+                    improvement_type=ImprovementType.CODE_QUALITY,
+                    priority=ImprovementPriority.MEDIUM,
+                    target_file=file_path,
+                    target_line=node.lineno,
+                    title=f"Long method '{node.name}' ({func_length} lines)",
+                    description=_LONG_METHOD_DESCRIPTION.format(
+                        name=node.name, lineno=node.lineno, length=func_length,
+                    ),
+                    proposed_changes=(
+                        f"Refactor function '{node.name}' into smaller, focused functions"
+                    ),
+                    rationale="Functions > 50 lines are typically doing too much and should be decomposed",
+                    impact="medium",
+                    effort="medium",
+                    analyzer_source=self.analyzer_name
+                ))
 
         return improvements
 
@@ -374,187 +699,143 @@ class CodeQualityAnalyzer(Analyzer):
         Returns:
             List of improvements for dead code removal
         """
+        try:
+            tree = self._parse_ast(code, file_path)
+            return self._detect_dead_code(_collect_quality_facts(tree), file_path)
+        except Exception as e:
+            logger.warning("Could not detect dead code in %s: %s", file_path, e)
+            return []
+
+    def _detect_dead_code(self, facts: _ModuleFacts, file_path: str) -> list[Improvement]:
+        """Emit dead-code improvements from pre-collected module facts."""
         improvements = []
 
-        try:
-            tree = ast.parse(code, filename=file_path)
-
-            # Track imports and their usage
-            imports = {}  # name -> (line, full_name)
-            names_used = set()
-
-            # First pass: collect all imports
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        name = alias.asname if alias.asname else alias.name
-                        imports[name] = (node.lineno, alias.name)
-
-                elif isinstance(node, ast.ImportFrom):
-                    for alias in node.names:
-                        name = alias.asname if alias.asname else alias.name
-                        imports[name] = (node.lineno, f"{node.module}.{alias.name}")
-
-            # Second pass: collect all name references
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Name):
-                    names_used.add(node.id)
-                elif isinstance(node, ast.Attribute):
-                    # For module.function calls, track module usage
-                    if isinstance(node.value, ast.Name):
-                        names_used.add(node.value.id)
-
-            # Find unused imports
-            unused_imports = []
-            for name, (line, full_name) in imports.items():
-                if name not in names_used:
-                    unused_imports.append((name, line, full_name))
-
-            # Create improvements for unused imports
-            if unused_imports:
-                for name, line, full_name in unused_imports:
+        imports = facts.imports  # name -> (line, full_name)
+        names_used = facts.names_used
+
+        # Find unused imports
+        unused_imports = []
+        for name, (line, full_name) in imports.items():
+            if name not in names_used:
+                unused_imports.append((name, line, full_name))
+
+        # Create improvements for unused imports
+        if unused_imports:
+            for name, line, full_name in unused_imports:
+                improvements.append(Improvement.create(
+                    improvement_type=ImprovementType.CODE_QUALITY,
+                    priority=ImprovementPriority.LOW,
+                    target_file=file_path,
+                    target_line=line,
+                    title=f"Unused import: {name}",
+                    description=_UNUSED_IMPORT_DESCRIPTION.format(
+                        full_name=full_name, lineno=line,
+                    ),
+                    proposed_changes=(
+                        f"Remove unused import '{full_name}' from line {line}"
+                    ),
+                    rationale="Unused imports add unnecessary clutter and slow module loading",
+                    impact="low",
+                    effort="trivial",
+                    analyzer_source=self.analyzer_name
+                ))
+
+        # Detect unused variables (simplified heuristic)
+        # Variable assignments and usage were tracked per function
+        for func in facts.functions:
+            node = func.node
+            # Find variables that are assigned but never used
+            unused_vars = func.assigned_vars - func.used_vars
+
+            # Filter out common patterns (skip _ prefixed, common names)
+            unused_vars = {
+                var for var in unused_vars
+                if not var.startswith('_') and var not in {'self', 'cls'}
+            }
+
+            if unused_vars:
+                # Report only the first few to avoid noise
+                for var in list(unused_vars)[:3]:
                     improvements.append(Improvement.create(
                         improvement_type=ImprovementType.CODE_QUALITY,
                         priority=ImprovementPriority.LOW,
                         target_file=file_path,
-                        target_line=line,
-                        title=f"Unused import: {name}",
-                        description=(
-                            f"Import '{full_name}' at line {line} is never used. "
-                            f"Unused imports clutter the code and can: "
-                            f"1) Slow down module loading, "
-                            f"2) Cause confusion about dependencies, "
-                            f"3) Hide actual import errors. "
-                            f"Remove unused imports to keep code clean."
+                        target_line=node.lineno,
+                        title=f"Unused variable '{var}' in function '{node.name}'",
+                        description=_UNUSED_VARIABLE_DESCRIPTION.format(
+                            var=var, name=node.name,
                         ),
                         proposed_changes=(
-                            f"Remove unused import '{full_name}' from line {line}"
+                            f"Remove unused variable '{var}' or prefix with '_' if intentionally unused"
                         ),
-                        rationale="Unused imports add unnecessary clutter and slow module loading",
+                        rationale="Unused variables clutter code and may indicate bugs or incomplete logic",
                         impact="low",
                         effort="trivial",
                         analyzer_source=self.analyzer_name
                     ))
 
-            # Detect unused variables (simplified heuristic)
-            # Track variable assignments and usage within functions
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    assigned_vars = set()
-                    used_vars = set()
-
-                    for child in ast.walk(node):
-                        # Track assignments
-                        if isinstance(child, ast.Assign):
-                            for target in child.targets:
-                                if isinstance(target, ast.Name):
-                                    assigned_vars.add(target.id)
-
-                        # Track usage (loads, not stores)
-                        if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load):
-                            used_vars.add(child.id)
-
-                    # Find variables that are assigned but never used
-                    unused_vars = assigned_vars - used_vars
-
-                    # Filter out common patterns (skip _ prefixed, common names)
-                    unused_vars = {
-                        var for var in unused_vars
-                        if not var.startswith('_') and var not in {'self', 'cls'}
-                    }
-
-                    if unused_vars:
-                        # Report only the first few to avoid noise
-                        for var in list(unused_vars)[:3]:
-                            improvements.append(Improvement.create(
-                                improvement_type=ImprovementType.CODE_QUALITY,
-                                priority=ImprovementPriority.LOW,
-                                target_file=file_path,
-                                target_line=node.lineno,
-                                title=f"Unused variable '{var}' in function '{node.name}'",
-                                description=(
-                                    f"Variable '{var}' is assigned but never used in function '{node.name}'. "
-                                    f"Unused variables can: "
-                                    f"1) Indicate incomplete code, "
-                                    f"2) Cause confusion about intent, "
-                                    f"3) Waste memory. "
-                                    f"Either use the variable or remove it. If intentionally unused, prefix with '_'."
-                                ),
-                                proposed_changes=(
-                                    f"Remove unused variable '{var}' or prefix with '_' if intentionally unused"
-                                ),
-                                rationale="Unused variables clutter code and may indicate bugs or incomplete logic",
-                                impact="low",
-                                effort="trivial",
-                                analyzer_source=self.analyzer_name
-                            ))
-
-        except Exception as e:
-            print(f"Warning: Could not detect dead code in {file_path}: {e}")
-
         return improvements
 
     # Helper methods
 
-    def _extract_python_files(self, task: 'Task') -> list[str]:
+    def _parse_file(self, file_path: str) -> tuple[str, ast.Module | None]:
         """
-        Extract Python file paths from task artifacts.
+        Read and parse a file, skipping both while the file is unchanged.
+
+        The file's mtime and size are checked first; only when they differ
+        from the cached entry is the file read and parsed again.
 
         Args:
-            task: Task with artifacts
+            file_path: Path to the Python source file
 
         Returns:
-            List of Python file paths (.py files)
-        """
-        python_files = []
-
-        # Task artifacts might be in task.artifacts or task.output_files
-        # For now, we'll check common locations
-        # This will be refined when Task model structure is finalized
+            Tuple of (source code, parsed module AST). The tree is None for
+            files over _MAX_ANALYZABLE_LINES, which are not parsed
 
-        # Placeholder: would extract from actual task artifacts
-        # For now, return empty list (will be populated by tests)
-        return python_files
+        Raises:
+            OSError: If the file cannot be read
+            SyntaxError: If the file is not valid Python
+        """
+        return self._file_cache.load(file_path, _load_source)
 
-    def _estimate_function_length(self, node: ast.FunctionDef, lines: list[str]) -> int:
+    def _parse_ast(self, code: str, file_path: str) -> ast.Module:
         """
-        Estimate function length when end_lineno is not available.
+        Parse source code, reusing the tree if the file's code is unchanged.
 
         Args:
-            node: FunctionDef node
-            lines: All lines of the source file
+            code: Python source code
+            file_path: Path to the source file (used in syntax error messages)
 
         Returns:
-            Estimated number of lines in the function
-        """
-        # Simple heuristic: count lines until next function def or class def or dedent
-        start_line = node.lineno - 1  # Convert to 0-indexed
-
-        if start_line >= len(lines):
-            return 1
+            Parsed module AST
 
-        # Get indentation of the function definition
-        func_line = lines[start_line]
-        func_indent = len(func_line) - len(func_line.lstrip())
+        Raises:
+            SyntaxError: If the code is not valid Python
+        """
+        cached = self._file_cache.lookup(file_path)
+        if cached is not None and cached[1] is not None and cached[0] == code:
+            return cached[1]
 
-        # Count lines until we hit same or lower indentation
-        length = 1
-        for i in range(start_line + 1, len(lines)):
-            line = lines[i]
-            stripped = line.lstrip()
+        tree = ast.parse(code, filename=file_path)
+        self._file_cache.store(file_path, (code, tree))
+        return tree
 
-            # Skip blank lines and comments
-            if not stripped or stripped.startswith('#'):
-                length += 1
-                continue
+    def _extract_python_files(self, task: 'Task') -> list[str]:
+        """
+        Extract Python file paths from task artifacts.
 
-            # Check indentation
-            line_indent = len(line) - len(stripped)
+        Args:
+            task: Task with artifacts
 
-            # If we're back to same or lower indentation, we've left the function
-            if line_indent <= func_indent:
-                break
+        Returns:
+            List of Python file paths (.py files)
+        """
+        python_files = []
 
-            length += 1
+        # Task artifacts might be in task.artifacts or task.output_files
+        # For now, we'll check common locations
+        # This will be refined when Task model structure is finalized
 
-        return length
+        # Placeholder: would extract from actual task artifacts
+        # For now, return empty list (will be populated by tests)
+        return python_files
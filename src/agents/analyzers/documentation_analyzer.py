@@ -9,17 +9,199 @@ This analyzer detects documentation gaps and quality issues in generated code, i
 """
 
 import ast
+import logging
 import os
 import re
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 from pathlib import Path
 
-from .base_analyzer import Analyzer
+from .base_analyzer import Analyzer, _DispatchVisitor, _FileCache, _order_by_priority, _parse_source
 from .models import Improvement, ImprovementType, ImprovementPriority
 
 if TYPE_CHECKING:
     from ...models import Task
 
+logger = logging.getLogger(__name__)
+
+
+_DEFINITION_TYPES = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Return value documentation: Google style (Returns:/Return:), Sphinx fields
+# (:returns:, :rtype:) and a return type written as in a signature
+_RETURN_DOC_PATTERN = re.compile(r'Returns?:|Return:|:returns?:|:rtype:|-> .+:', re.IGNORECASE)
+
+# Any whole word followed by a colon. This covers Google style (param:),
+# NumPy style (param :) and Sphinx style (:param param:) parameter entries
+_DOCUMENTED_NAME_PATTERN = re.compile(r'\b(\w+)\s*:')
+
+
+# Improvement description text; only the per-finding values vary
+_MODULE_DOCSTRING_DESCRIPTION = (
+    "Module '{file_path}' lacks a module-level docstring. "
+    "Module docstrings should explain: "
+    "1) Purpose of the module, "
+    "2) Key classes/functions provided, "
+    "3) Usage examples if appropriate. "
+    "Module docstrings appear in documentation tools and help users understand the module's role."
+)
+
+_CLASS_DOCSTRING_DESCRIPTION = (
+    "Public class '{name}' at line {lineno} has no docstring. "
+    "Class docstrings are critical for API documentation. "
+    "They should explain: "
+    "1) Purpose of the class, "
+    "2) Main responsibilities, "
+    "3) Usage examples, "
+    "4) Important attributes/methods. "
+    "Public classes without docstrings are difficult for users to understand."
+)
+
+_FUNCTION_DOCSTRING_DESCRIPTION = (
+    "Public function '{name}' at line {lineno} has no docstring.{complexity_note} "
+    "Function docstrings should document: "
+    "1) What the function does (brief description), "
+    "2) Parameters (Args section), "
+    "3) Return value (Returns section), "
+    "4) Exceptions raised (Raises section), "
+    "5) Usage examples if helpful. "
+    "Use Google-style or NumPy-style docstring format."
+)
+
+_PARAMETER_DOCS_DESCRIPTION = (
+    "Function '{name}' at line {lineno} has undocumented parameters: {params}. "
+    "Parameter documentation should include: "
+    "1) Type of each parameter, "
+    "2) Purpose/meaning of the parameter, "
+    "3) Valid values or constraints if applicable. "
+    "Example (Google style):\n"
+    "Args:\n"
+    "    {example}: Description of parameter\n"
+    "\n"
+    "Documenting parameters helps users understand how to call the function correctly."
+)
+
+_RETURN_DOCS_DESCRIPTION = (
+    "Function '{name}' at line {lineno} returns a value but doesn't document it. "
+    "Return value documentation should include: "
+    "1) Type of the return value, "
+    "2) Meaning/purpose of the returned data, "
+    "3) Possible return values (if limited set). "
+    "Example (Google style):\n"
+    "Returns:\n"
+    "    ReturnType: Description of return value\n"
+    "\n"
+    "Documenting return values helps users understand what to expect from the function."
+)
+
+_README_DESCRIPTION = (
+    "New public APIs were added in this task. "
+    "The README should be reviewed and updated to: "
+    "1) Document new features/functionality, "
+    "2) Add usage examples for new APIs, "
+    "3) Update installation instructions if needed, "
+    "4) Revise getting started guides, "
+    "5) Update feature lists or capabilities section. "
+    "Keeping the README current helps users discover and use new features."
+)
+
+
+def _extract_documented_params(docstring: str) -> set[str]:
+    """Return every name the docstring documents in a parameter style."""
+    return set(_DOCUMENTED_NAME_PATTERN.findall(docstring))
+
+
+def _defines_public_api(tree: ast.Module) -> bool:
+    """Return True if the tree defines a public class or function anywhere."""
+    # Module-level definitions settle almost every file; the whole tree is
+    # only walked when nothing public is defined at the top level
+    for nodes in (ast.iter_child_nodes(tree), ast.walk(tree)):
+        for node in nodes:
+            if type(node) in _DEFINITION_TYPES and not node.name.startswith('_'):
+                return True
+    return False
+
+
+@dataclass
+class _DefinitionFacts:
+    """Facts about one class or function, gathered in a single traversal of its module."""
+    node: ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef
+    # Function bodies only (nested definitions included, as ast.walk sees them)
+    has_return_value: bool = False
+    has_branch: bool = False
+
+
+@dataclass
+class _ModuleFacts:
+    """Class and function definitions of a module, in source order."""
+    definitions: list[_DefinitionFacts] = field(default_factory=list)
+    # A public class or function is defined at any depth
+    defines_public_api: bool = False
+
+
+class _DocFactsVisitor(_DispatchVisitor):
+    """
+    Walk a module once and collect _ModuleFacts for it.
+
+    A function context stack attributes returns and branches to every
+    enclosing function, matching what a per-function ast.walk would see.
+    """
+
+    def __init__(self):
+        self.facts = _ModuleFacts()
+        self._function_stack: list[_DefinitionFacts] = []
+        super().__init__({
+            ast.ClassDef: self.visit_ClassDef,
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.AsyncFunctionDef: self.visit_AsyncFunctionDef,
+            ast.Return: self.visit_Return,
+            ast.For: self.visit_For,
+            ast.While: self.visit_While,
+            ast.If: self.visit_If,
+        })
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.facts.definitions.append(_DefinitionFacts(node=node))
+        if not node.name.startswith('_'):
+            self.facts.defines_public_api = True
+        self.generic_visit(node)
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef):
+        facts = _DefinitionFacts(node=node)
+        self.facts.definitions.append(facts)
+        if not node.name.startswith('_'):
+            self.facts.defines_public_api = True
+        self._function_stack.append(facts)
+        self.generic_visit(node)
+        self._function_stack.pop()
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    def visit_Return(self, node: ast.Return):
+        # Returning a value (not just 'return' or an explicit 'return None')
+        value = node.value
+        if value is not None and not (type(value) is ast.Constant and value.value is None):
+            for facts in self._function_stack:
+                facts.has_return_value = True
+        self.generic_visit(node)
+
+    def _visit_branch(self, node: ast.For | ast.While | ast.If):
+        for facts in self._function_stack:
+            facts.has_branch = True
+        self.generic_visit(node)
+
+    visit_For = _visit_branch
+    visit_While = _visit_branch
+    visit_If = _visit_branch
+
+
+def _collect_doc_facts(node: ast.AST) -> _ModuleFacts:
+    """Return facts for a module (or a single function) using one traversal."""
+    visitor = _DocFactsVisitor()
+    visitor.visit(node)
+    return visitor.facts
+
 
 class DocumentationAnalyzer(Analyzer):
     """
@@ -30,6 +212,10 @@ class DocumentationAnalyzer(Analyzer):
     documentation, and README maintenance.
     """
 
+    def __init__(self):
+        # Parsed trees, reused across analyze() calls while files are unchanged
+        self._ast_cache = _FileCache()
+
     @property
     def analyzer_name(self) -> str:
         """Return analyzer name."""
@@ -53,43 +239,47 @@ class DocumentationAnalyzer(Analyzer):
         if not python_files:
             return improvements
 
-        # Check docstring completeness for each file
-        for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    code = f.read()
+        # Improvements from one run share a single created_at timestamp
+        with Improvement.batch():
+            # Each file reports whether it defines public API while its tree is
+            # at hand, so the README check needs no second pass over the files
+            has_new_public_api = False
 
-                improvements.extend(self.check_docstring_completeness(code, file_path))
+            for file_path in python_files:
+                file_improvements, defines_public_api = self._analyze_file(file_path)
+                improvements.extend(file_improvements)
+                has_new_public_api = has_new_public_api or defines_public_api
 
-                # Parse AST for detailed analysis
-                tree = ast.parse(code, filename=file_path)
+            # Check README updates
+            improvements.extend(self._check_readme(has_new_public_api))
 
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        # Skip private functions for parameter/return docs
-                        if not node.name.startswith('_'):
-                            improvements.extend(self.validate_parameter_docs(node, file_path))
-                            improvements.extend(self.check_return_value_docs(node, file_path))
+        # Order by priority: HIGH → MEDIUM → LOW
+        return _order_by_priority(improvements)
 
-            except SyntaxError as e:
-                print(f"Warning: Syntax error in {file_path}: {e}")
-                continue
-            except Exception as e:
-                print(f"Warning: Could not analyze {file_path}: {e}")
-                continue
-
-        # Check README updates
-        improvements.extend(self.check_readme_updates(task))
+    def _analyze_file(self, file_path: str) -> tuple[list[Improvement], bool]:
+        """
+        Run the per-file documentation checks.
 
-        # Sort by priority: HIGH → MEDIUM → LOW
-        priority_order = {
-            ImprovementPriority.HIGH: 0,
-            ImprovementPriority.MEDIUM: 1,
-            ImprovementPriority.LOW: 2,
-        }
-        improvements.sort(key=lambda imp: priority_order[imp.priority])
+        Args:
+            file_path: Path to the Python file
 
-        return improvements
+        Returns:
+            Improvements for the file and whether it defines public API;
+            ([], False) if it cannot be read or parsed
+        """
+        try:
+            # Parse once; docstring, parameter and return value checks and
+            # the README check's public API flag share a single walk of the tree
+            tree = self._parse_file(file_path)
+            facts = _collect_doc_facts(tree)
+            return self._check_tree(tree, file_path, facts=facts), facts.defines_public_api
+
+        except SyntaxError as e:
+            logger.warning("Syntax error in %s: %s", file_path, e)
+            return [], False
+        except Exception as e:
+            logger.warning("Could not analyze %s: %s", file_path, e)
+            return [], False
 
     def check_docstring_completeness(self, code: str, file_path: str) -> list[Improvement]:
         """
@@ -102,109 +292,144 @@ class DocumentationAnalyzer(Analyzer):
         Returns:
             List of improvements for missing docstrings
         """
-        improvements = []
-
         try:
             tree = ast.parse(code, filename=file_path)
+            return self._check_tree(tree, file_path, check_signatures=False)
+        except Exception as e:
+            logger.warning("Could not check docstring completeness in %s: %s", file_path, e)
+            return []
 
-            # Check module-level docstring
-            module_docstring = ast.get_docstring(tree)
-            if not module_docstring:
-                improvements.append(Improvement.create(
-                    improvement_type=ImprovementType.DOCUMENTATION,
-                    priority=ImprovementPriority.MEDIUM,
-                    target_file=file_path,
-                    target_line=1,
-                    title="Missing module-level docstring",
-                    description=(
-                        f"Module '{file_path}' lacks a module-level docstring. "
-                        f"Module docstrings should explain: "
-                        f"1) Purpose of the module, "
-                        f"2) Key classes/functions provided, "
-                        f"3) Usage examples if appropriate. "
-                        f"Module docstrings appear in documentation tools and help users understand the module's role."
-                    ),
-                    proposed_changes=(
-                        f"Add module-level docstring to {file_path}"
-                    ),
-                    rationale="Module docstrings provide essential context for understanding code organization",
-                    impact="medium",
-                    effort="trivial",
-                    analyzer_source=self.analyzer_name
-                ))
-
-            # Check classes and functions
-            for node in ast.walk(tree):
-                # Check class docstrings
-                if isinstance(node, ast.ClassDef):
-                    if not node.name.startswith('_'):  # Public class
-                        docstring = ast.get_docstring(node)
-                        if not docstring:
-                            improvements.append(Improvement.create(
-                                improvement_type=ImprovementType.DOCUMENTATION,
-                                priority=ImprovementPriority.HIGH,
-                                target_file=file_path,
-                                target_line=node.lineno,
-                                title=f"Missing docstring for public class '{node.name}'",
-                                description=(
-                                    f"Public class '{node.name}' at line {node.lineno} has no docstring. "
-                                    f"Class docstrings are critical for API documentation. "
-                                    f"They should explain: "
-                                    f"1) Purpose of the class, "
-                                    f"2) Main responsibilities, "
-                                    f"3) Usage examples, "
-                                    f"4) Important attributes/methods. "
-                                    f"Public classes without docstrings are difficult for users to understand."
-                                ),
-                                proposed_changes=(
-                                    f"Add docstring to class '{node.name}'"
-                                ),
-                                rationale="Public classes require docstrings for API documentation and user understanding",
-                                impact="high",
-                                effort="trivial",
-                                analyzer_source=self.analyzer_name
-                            ))
-
-                # Check function docstrings
-                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    if not node.name.startswith('_'):  # Public function
-                        docstring = ast.get_docstring(node)
-                        if not docstring:
-                            # Determine if this is a complex function
-                            is_complex = self._is_complex_function(node)
-
-                            priority = ImprovementPriority.HIGH if is_complex else ImprovementPriority.MEDIUM
-                            impact = "high" if is_complex else "medium"
-
-                            complexity_note = " This function appears complex and especially needs documentation." if is_complex else ""
-
-                            improvements.append(Improvement.create(
-                                improvement_type=ImprovementType.DOCUMENTATION,
-                                priority=priority,
-                                target_file=file_path,
-                                target_line=node.lineno,
-                                title=f"Missing docstring for public function '{node.name}'",
-                                description=(
-                                    f"Public function '{node.name}' at line {node.lineno} has no docstring.{complexity_note} "
-                                    f"Function docstrings should document: "
-                                    f"1) What the function does (brief description), "
-                                    f"2) Parameters (Args section), "
-                                    f"3) Return value (Returns section), "
-                                    f"4) Exceptions raised (Raises section), "
-                                    f"5) Usage examples if helpful. "
-                                    f"Use Google-style or NumPy-style docstring format."
-                                ),
-                                proposed_changes=(
-                                    f"Add comprehensive docstring to function '{node.name}'"
-                                ),
-                                rationale="Public functions require docstrings for API documentation and maintainability",
-                                impact=impact,
-                                effort="trivial",
-                                analyzer_source=self.analyzer_name
-                            ))
+    def _check_tree(
+        self,
+        tree: ast.Module,
+        file_path: str,
+        check_signatures: bool = True,
+        facts: _ModuleFacts | None = None
+    ) -> list[Improvement]:
+        """
+        Run the per-file documentation checks in a single walk of a parsed module.
 
-        except Exception as e:
-            print(f"Warning: Could not check docstring completeness in {file_path}: {e}")
+        Docstring findings come first, followed by parameter and return value
+        findings for public functions, the same order as running
+        check_docstring_completeness() before the per-function checks.
+
+        Args:
+            tree: Parsed module AST
+            file_path: Path to the source file
+            check_signatures: Also validate parameter and return value docs
+            facts: Facts already collected for the tree; collected here if None
+
+        Returns:
+            List of improvements for the module
+        """
+        if facts is None:
+            facts = _collect_doc_facts(tree)
+
+        improvements = self._check_module_docstring(tree, file_path)
+        signature_improvements = []
+
+        for definition in facts.definitions:
+            node = definition.node
+            if node.name.startswith('_'):  # Private definition
+                continue
+
+            if type(node) is ast.ClassDef:
+                improvements.extend(self._check_class_docstring(node, file_path))
+            else:
+                improvements.extend(self._check_function_docstring(definition, file_path))
+                if check_signatures:
+                    signature_improvements.extend(self.validate_parameter_docs(node, file_path))
+                    signature_improvements.extend(self._check_return_docs(definition, file_path))
+
+        improvements.extend(signature_improvements)
+        return improvements
+
+    def _check_module_docstring(self, tree: ast.Module, file_path: str) -> list[Improvement]:
+        """Flag a module without a module-level docstring."""
+        improvements = []
+
+        module_docstring = ast.get_docstring(tree)
+        if not module_docstring:
+            improvements.append(Improvement.create(
+                improvement_type=ImprovementType.DOCUMENTATION,
+                priority=ImprovementPriority.MEDIUM,
+                target_file=file_path,
+                target_line=1,
+                title="Missing module-level docstring",
+                description=_MODULE_DOCSTRING_DESCRIPTION.format(file_path=file_path),
+                proposed_changes=(
+                    f"Add module-level docstring to {file_path}"
+                ),
+                rationale="Module docstrings provide essential context for understanding code organization",
+                impact="medium",
+                effort="trivial",
+                analyzer_source=self.analyzer_name
+            ))
+
+        return improvements
+
+    def _check_class_docstring(self, node: ast.ClassDef, file_path: str) -> list[Improvement]:
+        """Flag a public class without a docstring."""
+        improvements = []
+
+        docstring = ast.get_docstring(node)
+        if not docstring:
+            improvements.append(Improvement.create(
+                improvement_type=ImprovementType.DOCUMENTATION,
+                priority=ImprovementPriority.HIGH,
+                target_file=file_path,
+                target_line=node.lineno,
+                title=f"Missing docstring for public class '{node.name}'",
+                description=_CLASS_DOCSTRING_DESCRIPTION.format(
+                    name=node.name, lineno=node.lineno,
+                ),
+                proposed_changes=(
+                    f"Add docstring to class '{node.name}'"
+                ),
+                rationale="Public classes require docstrings for API documentation and user understanding",
+                impact="high",
+                effort="trivial",
+                analyzer_source=self.analyzer_name
+            ))
+
+        return improvements
+
+    def _check_function_docstring(
+        self,
+        facts: _DefinitionFacts,
+        file_path: str
+    ) -> list[Improvement]:
+        """Flag a public function without a docstring, with higher priority when complex."""
+        improvements = []
+
+        node = facts.node
+        docstring = ast.get_docstring(node)
+        if not docstring:
+            # Determine if this is a complex function
+            is_complex = self._is_complex(facts)
+
+            priority = ImprovementPriority.HIGH if is_complex else ImprovementPriority.MEDIUM
+            impact = "high" if is_complex else "medium"
+
+            complexity_note = " This function appears complex and especially needs documentation." if is_complex else ""
+
+            improvements.append(Improvement.create(
+                improvement_type=ImprovementType.DOCUMENTATION,
+                priority=priority,
+                target_file=file_path,
+                target_line=node.lineno,
+                title=f"Missing docstring for public function '{node.name}'",
+                description=_FUNCTION_DOCSTRING_DESCRIPTION.format(
+                    name=node.name, lineno=node.lineno, complexity_note=complexity_note,
+                ),
+                proposed_changes=(
+                    f"Add comprehensive docstring to function '{node.name}'"
+                ),
+                rationale="Public functions require docstrings for API documentation and maintainability",
+                impact=impact,
+                effort="trivial",
+                analyzer_source=self.analyzer_name
+            ))
 
         return improvements
 
@@ -248,22 +473,10 @@ class DocumentationAnalyzer(Analyzer):
             # No parameters to document
             return improvements
 
-        # Check which parameters are documented
-        undocumented_params = []
-
-        for param in params:
-            # Look for parameter in docstring
-            # Support both Google style (Args:) and NumPy style (Parameters:)
-            param_patterns = [
-                rf'\b{re.escape(param)}\s*:',  # Google style: param:
-                rf'\b{re.escape(param)}\s+:',  # NumPy style: param :
-                rf':{re.escape(param)}:',      # Sphinx style: :param param:
-            ]
-
-            documented = any(re.search(pattern, docstring) for pattern in param_patterns)
-
-            if not documented:
-                undocumented_params.append(param)
+        # Check which parameters are documented; the docstring is scanned
+        # once regardless of how many parameters the function has
+        documented = _extract_documented_params(docstring)
+        undocumented_params = [param for param in params if param not in documented]
 
         if undocumented_params:
             param_list = ', '.join(undocumented_params)
@@ -274,17 +487,9 @@ class DocumentationAnalyzer(Analyzer):
                 target_file=file_path,
                 target_line=function_node.lineno,
                 title=f"Undocumented parameters in function '{function_node.name}': {param_list}",
-                description=(
-                    f"Function '{function_node.name}' at line {function_node.lineno} has undocumented parameters: {param_list}. "
-                    f"Parameter documentation should include: "
-                    f"1) Type of each parameter, "
-                    f"2) Purpose/meaning of the parameter, "
-                    f"3) Valid values or constraints if applicable. "
-                    f"Example (Google style):\n"
-                    f"Args:\n"
-                    f"    {undocumented_params[0]}: Description of parameter\n"
-                    f"\n"
-                    f"Documenting parameters helps users understand how to call the function correctly."
+                description=_PARAMETER_DOCS_DESCRIPTION.format(
+                    name=function_node.name, lineno=function_node.lineno,
+                    params=param_list, example=undocumented_params[0],
                 ),
                 proposed_changes=(
                     f"Add parameter documentation for: {param_list}"
@@ -312,21 +517,14 @@ class DocumentationAnalyzer(Analyzer):
         Returns:
             List of improvements for undocumented return values
         """
-        improvements = []
+        return self._check_return_docs(_collect_doc_facts(function_node).definitions[0], file_path)
 
-        # Check if function has return statements
-        has_return_value = False
-
-        for node in ast.walk(function_node):
-            if isinstance(node, ast.Return):
-                # Check if returning a value (not just 'return' or 'return None')
-                if node.value is not None:
-                    # Check if it's returning None explicitly
-                    if not (isinstance(node.value, ast.Constant) and node.value.value is None):
-                        has_return_value = True
-                        break
+    def _check_return_docs(self, facts: _DefinitionFacts, file_path: str) -> list[Improvement]:
+        """Emit a return value documentation improvement from pre-collected function facts."""
+        improvements = []
+        function_node = facts.node
 
-        if not has_return_value:
+        if not facts.has_return_value:
             # Function doesn't return a value, no need to document
             return improvements
 
@@ -338,16 +536,7 @@ class DocumentationAnalyzer(Analyzer):
             return improvements
 
         # Check if return value is documented
-        # Look for common return documentation patterns
-        return_patterns = [
-            r'Returns?:',           # Google style
-            r'Return:',             # Alternative
-            r':returns?:',          # Sphinx style
-            r':rtype:',             # Sphinx return type
-            r'-> .+:',              # Return type hint in signature
-        ]
-
-        has_return_docs = any(re.search(pattern, docstring, re.IGNORECASE) for pattern in return_patterns)
+        has_return_docs = _RETURN_DOC_PATTERN.search(docstring) is not None
 
         if not has_return_docs:
             improvements.append(Improvement.create(
@@ -356,17 +545,8 @@ class DocumentationAnalyzer(Analyzer):
                 target_file=file_path,
                 target_line=function_node.lineno,
                 title=f"Missing return value documentation in function '{function_node.name}'",
-                description=(
-                    f"Function '{function_node.name}' at line {function_node.lineno} returns a value but doesn't document it. "
-                    f"Return value documentation should include: "
-                    f"1) Type of the return value, "
-                    f"2) Meaning/purpose of the returned data, "
-                    f"3) Possible return values (if limited set). "
-                    f"Example (Google style):\n"
-                    f"Returns:\n"
-                    f"    ReturnType: Description of return value\n"
-                    f"\n"
-                    f"Documenting return values helps users understand what to expect from the function."
+                description=_RETURN_DOCS_DESCRIPTION.format(
+                    name=function_node.name, lineno=function_node.lineno,
                 ),
                 proposed_changes=(
                     f"Add return value documentation to function '{function_node.name}'"
@@ -392,8 +572,6 @@ class DocumentationAnalyzer(Analyzer):
         Returns:
             List of improvements for README maintenance
         """
-        improvements = []
-
         # Try to find README file
         # Common locations: README.md, README.rst, README.txt
         readme_patterns = ['README.md', 'README.rst', 'README.txt', 'readme.md']
@@ -411,24 +589,28 @@ class DocumentationAnalyzer(Analyzer):
 
         for file_path in python_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    code = f.read()
-
-                tree = ast.parse(code, filename=file_path)
-
-                for node in ast.walk(tree):
-                    # Check for public classes and functions
-                    if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
-                        if not node.name.startswith('_'):
-                            has_new_public_api = True
-                            break
-
-                if has_new_public_api:
+                if _defines_public_api(self._parse_file(file_path)):
+                    has_new_public_api = True
                     break
 
             except Exception:
                 continue
 
+        return self._check_readme(has_new_public_api)
+
+    def _check_readme(self, has_new_public_api: bool) -> list[Improvement]:
+        """
+        Suggest a README review when new public API was added.
+
+        Args:
+            has_new_public_api: Whether any analyzed file defines a public
+                class or function
+
+        Returns:
+            List of improvements for README maintenance
+        """
+        improvements = []
+
         # If new public API was added, suggest README review
         if has_new_public_api:
             improvements.append(Improvement.create(
@@ -437,16 +619,7 @@ class DocumentationAnalyzer(Analyzer):
                 target_file="README.md",
                 target_line=None,
                 title="README may need updates for new functionality",
-                description=(
-                    f"New public APIs were added in this task. "
-                    f"The README should be reviewed and updated to: "
-                    f"1) Document new features/functionality, "
-                    f"2) Add usage examples for new APIs, "
-                    f"3) Update installation instructions if needed, "
-                    f"4) Revise getting started guides, "
-                    f"5) Update feature lists or capabilities section. "
-                    f"Keeping the README current helps users discover and use new features."
-                ),
+                description=_README_DESCRIPTION,
                 proposed_changes=(
                     "Review and update README.md to reflect new functionality"
                 ),
@@ -480,6 +653,26 @@ class DocumentationAnalyzer(Analyzer):
         # For now, return empty list (will be populated by tests)
         return python_files
 
+    def _parse_file(self, file_path: str) -> ast.Module:
+        """
+        Parse a file, reusing the cached tree while the file is unchanged.
+
+        The cache checks the file's mtime and size, so each file is read and
+        parsed at most once per analyze() call (the README check reuses the
+        tree) and not at all on re-analysis of unchanged artifacts.
+
+        Args:
+            file_path: Path to the Python source file
+
+        Returns:
+            Parsed module AST
+
+        Raises:
+            OSError: If the file cannot be read
+            SyntaxError: If the file is not valid Python
+        """
+        return self._ast_cache.load(file_path, _parse_source)
+
     def _is_complex_function(self, function_node: ast.FunctionDef) -> bool:
         """
         Heuristic to determine if a function is complex and needs documentation.
@@ -495,6 +688,12 @@ class DocumentationAnalyzer(Analyzer):
         Returns:
             True if function is complex, False otherwise
         """
+        return self._is_complex(_collect_doc_facts(function_node).definitions[0])
+
+    def _is_complex(self, facts: _DefinitionFacts) -> bool:
+        """Apply the _is_complex_function() heuristic to pre-collected function facts."""
+        function_node = facts.node
+
         # Check parameter count
         param_count = len(function_node.args.args)
         if function_node.args.args and function_node.args.args[0].arg in ('self', 'cls'):
@@ -504,12 +703,11 @@ class DocumentationAnalyzer(Analyzer):
             return True
 
         # Check for loops and conditionals (indicates complexity)
-        for node in ast.walk(function_node):
-            if isinstance(node, (ast.For, ast.While, ast.If)):
-                return True
+        if facts.has_branch:
+            return True
 
-        # Check line count (if end_lineno available)
-        if hasattr(function_node, 'end_lineno') and function_node.end_lineno:
+        # Check line count (end_lineno is None only on hand-built nodes)
+        if function_node.end_lineno:
             line_count = function_node.end_lineno - function_node.lineno + 1
             if line_count > 20:
                 return True
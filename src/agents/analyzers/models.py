@@ -5,9 +5,38 @@ Defines the Improvement dataclass and related enums for representing
 improvement opportunities detected by analyzer modules.
 """
 
+import itertools
+import os
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum
-from datetime import datetime
+from typing import Iterator
+
+
+# Improvement IDs count up from a random 48-bit start chosen once per
+# process: unique within a run without an os.urandom() call per improvement,
+# and as unlikely to collide across runs and processes as random IDs
+_ID_MASK = (1 << 48) - 1
+_id_counter = itertools.count(int.from_bytes(os.urandom(6), 'big'))
+
+
+def _reset_id_sequence() -> None:
+    """Give a forked child (e.g. a process pool worker) its own ID sequence."""
+    global _id_counter
+    _id_counter = itertools.count(int.from_bytes(os.urandom(6), 'big'))
+
+
+# Not available on Windows, which has no fork() to guard against
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_id_sequence)
+
+# Shared created_at for improvements made inside Improvement.batch(). A
+# context variable rather than a class attribute: analyzers run concurrently
+# in threads, and each thread (or asyncio task) sees only its own batch
+_batch_timestamp: ContextVar[str | None] = ContextVar('_batch_timestamp', default=None)
 
 
 class ImprovementType(Enum):
@@ -27,13 +56,16 @@ class ImprovementPriority(Enum):
     LOW = "low"
 
 
-@dataclass
+@dataclass(slots=True)
 class Improvement:
     """
     Represents a single improvement opportunity detected by an analyzer.
 
     This dataclass contains all information needed to understand,
     evaluate, and implement an improvement suggestion.
+
+    Analyzers create many of these per task, so instances use __slots__
+    rather than a per-instance __dict__.
     """
     improvement_id: str
     improvement_type: ImprovementType
@@ -82,6 +114,13 @@ class Improvement:
                 f"got {type(self.priority)}"
             )
 
+        # A handful of distinct values repeated across every improvement;
+        # share one string object each (values loaded from storage are
+        # otherwise separate copies)
+        self.impact = sys.intern(self.impact)
+        self.effort = sys.intern(self.effort)
+        self.analyzer_source = sys.intern(self.analyzer_source)
+
     def to_dict(self) -> dict:
         """
         Convert improvement to dictionary for serialization.
@@ -105,6 +144,24 @@ class Improvement:
             'analyzer_source': self.analyzer_source,
         }
 
+    @classmethod
+    @contextmanager
+    def batch(cls) -> Iterator[None]:
+        """
+        Stamp every improvement created inside the block with one timestamp.
+
+        An analyzer run produces its improvements at effectively the same
+        moment, so create() reuses the timestamp taken on entry instead of
+        reading the clock per improvement. The batch applies only to the
+        current thread or asyncio task; analyzers running alongside it
+        keep their own timestamps.
+        """
+        token = _batch_timestamp.set(datetime.now(timezone.utc).isoformat())
+        try:
+            yield
+        finally:
+            _batch_timestamp.reset(token)
+
     @classmethod
     def create(
         cls,
@@ -139,11 +196,8 @@ class Improvement:
         Returns:
             New Improvement instance with generated ID and timestamp
         """
-        import uuid
-        from datetime import timezone
-
-        improvement_id = f"imp_{uuid.uuid4().hex[:12]}"
-        created_at = datetime.now(timezone.utc).isoformat()
+        improvement_id = f"imp_{next(_id_counter) & _ID_MASK:012x}"
+        created_at = _batch_timestamp.get() or datetime.now(timezone.utc).isoformat()
 
         return cls(
             improvement_id=improvement_id,
@@ -9,15 +9,230 @@ in generated code, including:
 """
 
 import ast
+import logging
 import os
+import re
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from .base_analyzer import Analyzer
+from .base_analyzer import Analyzer, _DispatchVisitor, _FileCache, _order_by_priority
 from .models import Improvement, ImprovementType, ImprovementPriority
 
 if TYPE_CHECKING:
     from ...models import Task
 
+logger = logging.getLogger(__name__)
+
+
+# Heuristic: calls with "query", "get", "fetch", "find" might be database ops.
+# Matched against the lowercased name; one compiled alternation instead of
+# a substring scan per keyword
+_DB_CALL_PATTERN = re.compile(r'query|get|fetch|find|select|execute')
+
+# Every check needs a loop or a function definition. Source without any of
+# these keywords (comments and strings included) has nothing to report, so
+# it is not parsed at all
+_TRIGGER_PATTERN = re.compile(rb'\b(?:for|while|def)\b')
+
+
+@dataclass
+class _FunctionFacts:
+    """Calls made within one function, nested definitions included."""
+    node: ast.FunctionDef | ast.AsyncFunctionDef
+    # (call, called name) for calls whose name can be determined
+    calls: list[tuple[ast.Call, str]] = field(default_factory=list)
+
+
+@dataclass
+class _LoopFacts:
+    """One for/while loop and how deeply loops nest inside it."""
+    node: ast.For | ast.While
+    # Not inside another loop; the loop a nested-loop report is about
+    outermost: bool = True
+    # 1 for a loop with no loop inside it, 2 for a nested loop, and so on
+    nesting: int = 1
+
+
+@dataclass
+class _ModuleFacts:
+    """Facts for the performance checks, in source order."""
+    loops: list[_LoopFacts] = field(default_factory=list)
+    functions: list[_FunctionFacts] = field(default_factory=list)
+    # Inside a for/while loop, its header included; a node nested in
+    # several loops is recorded once. Augmented assignments are paired with
+    # the names evidently bound to strings in their function (or module)
+    # scope; the set is complete once the traversal finishes
+    loop_aug_assigns: list[tuple[ast.AugAssign, set[str]]] = field(default_factory=list)
+    loop_calls: list[tuple[ast.Call, str]] = field(default_factory=list)
+    # name.append(...) calls that are the whole body of a loop, i.e. loops
+    # that only build a list
+    loop_appends: list[ast.Call] = field(default_factory=list)
+
+
+class _PerformanceFactsVisitor(_DispatchVisitor):
+    """
+    Walk a module once and collect _ModuleFacts for it.
+
+    A function context stack attributes each call to every enclosing
+    function, matching what a per-function ast.walk would see. A call's
+    name is extracted once, however many functions and loops enclose it.
+    Loop nesting is computed on the way back up, so each loop subtree is
+    visited once however deeply loops nest.
+    """
+
+    def __init__(self):
+        self.facts = _ModuleFacts()
+        self._function_stack: list[_FunctionFacts] = []
+        # Names bound to strings, one set per scope (module first)
+        self._str_names_stack: list[set[str]] = [set()]
+        self._loop_depth = 0
+        # Deepest loop nesting seen so far below the current loop
+        self._inner_nesting = 0
+        super().__init__({
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.AsyncFunctionDef: self.visit_AsyncFunctionDef,
+            ast.For: self.visit_For,
+            ast.While: self.visit_While,
+            ast.Assign: self.visit_Assign,
+            ast.AnnAssign: self.visit_AnnAssign,
+            ast.AugAssign: self.visit_AugAssign,
+            ast.Call: self.visit_Call,
+        })
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef):
+        facts = _FunctionFacts(node=node)
+        self.facts.functions.append(facts)
+        self._function_stack.append(facts)
+
+        arguments = node.args
+        self._str_names_stack.append({
+            arg.arg
+            for arg in (*arguments.posonlyargs, *arguments.args, *arguments.kwonlyargs)
+            if _is_str_annotation(arg.annotation)
+        })
+
+        self.generic_visit(node)
+        self._str_names_stack.pop()
+        self._function_stack.pop()
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    def _visit_loop(self, node: ast.For | ast.While):
+        facts = _LoopFacts(node=node, outermost=not self._loop_depth)
+        self.facts.loops.append(facts)
+
+        body = node.body
+        if len(body) == 1 and type(body[0]) is ast.Expr:
+            call = body[0].value
+            if (
+                type(call) is ast.Call
+                and type(call.func) is ast.Attribute
+                and call.func.attr == 'append'
+                and type(call.func.value) is ast.Name
+            ):
+                self.facts.loop_appends.append(call)
+
+        outer_nesting = self._inner_nesting
+        self._inner_nesting = 0
+        self._loop_depth += 1
+        self.generic_visit(node)
+        self._loop_depth -= 1
+
+        facts.nesting = self._inner_nesting + 1
+        self._inner_nesting = max(outer_nesting, facts.nesting)
+
+    visit_For = _visit_loop
+    visit_While = _visit_loop
+
+    def visit_Assign(self, node: ast.Assign):
+        if _is_str_value(node.value):
+            str_names = self._str_names_stack[-1]
+            for target in node.targets:
+                if type(target) is ast.Name:
+                    str_names.add(target.id)
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign):
+        target = node.target
+        if type(target) is ast.Name and (
+            _is_str_annotation(node.annotation)
+            or (node.value is not None and _is_str_value(node.value))
+        ):
+            self._str_names_stack[-1].add(target.id)
+        self.generic_visit(node)
+
+    def visit_AugAssign(self, node: ast.AugAssign):
+        str_names = self._str_names_stack[-1]
+        # 'name += "text"' is itself evidence that name holds a string
+        if type(node.target) is ast.Name and _is_str_value(node.value):
+            str_names.add(node.target.id)
+        if self._loop_depth:
+            self.facts.loop_aug_assigns.append((node, str_names))
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        func_name = _get_call_name(node)
+        if func_name:
+            call = (node, func_name)
+            for facts in self._function_stack:
+                facts.calls.append(call)
+            if self._loop_depth:
+                self.facts.loop_calls.append(call)
+        self.generic_visit(node)
+
+
+def _is_str_value(node: ast.expr) -> bool:
+    """Return True if the expression evidently evaluates to a str."""
+    if type(node) is ast.Constant:
+        return type(node.value) is str
+    if type(node) is ast.JoinedStr:
+        return True
+    if type(node) is ast.BinOp:
+        # "a" + x, x + "a", "%s" % x
+        if type(node.op) is ast.Add:
+            return _is_str_value(node.left) or _is_str_value(node.right)
+        if type(node.op) is ast.Mod:
+            return _is_str_value(node.left)
+        return False
+    if type(node) is ast.Call:
+        func = node.func
+        # str(...), or "sep".join(...) / "template".format(...)
+        if type(func) is ast.Name:
+            return func.id == 'str'
+        if type(func) is ast.Attribute and func.attr in ('join', 'format'):
+            return type(func.value) is ast.Constant and type(func.value.value) is str
+    return False
+
+
+def _is_str_annotation(annotation: ast.expr | None) -> bool:
+    """Return True for a plain 'str' annotation."""
+    return type(annotation) is ast.Name and annotation.id == 'str'
+
+
+def _get_call_name(call_node: ast.Call) -> str | None:
+    """Return the called function or method name, or None if it cannot be determined."""
+    func = call_node.func
+    if isinstance(func, ast.Name):
+        return func.id
+    elif isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def _collect_performance_facts(tree: ast.AST) -> _ModuleFacts:
+    """Collect the performance facts for a module in a single traversal."""
+    visitor = _PerformanceFactsVisitor()
+    visitor.visit(tree)
+    return visitor.facts
+
+
+def _load_facts(source: bytes, file_path: str) -> _ModuleFacts:
+    """Parse raw file bytes and collect their facts; a _FileCache.load() loader."""
+    if not _TRIGGER_PATTERN.search(source):
+        return _ModuleFacts()
+    return _collect_performance_facts(ast.parse(source, filename=file_path))
+
 
 class PerformanceAnalyzer(Analyzer):
     """
@@ -28,6 +243,10 @@ class PerformanceAnalyzer(Analyzer):
     performance anti-patterns.
     """
 
+    def __init__(self):
+        # Collected facts, reused across analyze() calls while files are unchanged
+        self._facts_cache = _FileCache()
+
     @property
     def analyzer_name(self) -> str:
         """Return analyzer name."""
@@ -52,30 +271,38 @@ class PerformanceAnalyzer(Analyzer):
             return improvements
 
         # Run all detection methods
-        improvements.extend(self.detect_slow_operations(python_files))
-
         for file_path in python_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    code = f.read()
+            improvements.extend(self._analyze_file(file_path))
 
-                improvements.extend(self.suggest_caching_opportunities(code, file_path))
-                improvements.extend(self.detect_algorithm_inefficiencies(code, file_path))
+        # Order by priority: HIGH → MEDIUM → LOW
+        return _order_by_priority(improvements)
 
-            except Exception as e:
-                # Log warning and continue (graceful error handling per constraint 7)
-                print(f"Warning: Could not analyze {file_path}: {e}")
-                continue
+    def _analyze_file(self, file_path: str) -> list[Improvement]:
+        """
+        Run all detection methods on one file.
 
-        # Sort by priority: HIGH → MEDIUM → LOW
-        priority_order = {
-            ImprovementPriority.HIGH: 0,
-            ImprovementPriority.MEDIUM: 1,
-            ImprovementPriority.LOW: 2,
-        }
-        improvements.sort(key=lambda imp: priority_order[imp.priority])
+        Args:
+            file_path: Path to the Python file
 
-        return improvements
+        Returns:
+            Improvements for the file; empty if it cannot be read or parsed
+        """
+        try:
+            # Read, parse and traverse once; every detector works on the same facts
+            facts = self._file_facts(file_path)
+            improvements = self._find_slow_operations(facts, file_path)
+            improvements.extend(self._find_caching_opportunities(facts, file_path))
+            improvements.extend(self._find_algorithm_inefficiencies(facts, file_path))
+            return improvements
+
+        except SyntaxError as e:
+            # Invalid Python syntax - log and continue
+            logger.warning("Syntax error in %s: %s", file_path, e)
+            return []
+        except Exception as e:
+            # Log warning and continue (graceful error handling per constraint 7)
+            logger.warning("Could not analyze %s: %s", file_path, e)
+            return []
 
     def detect_slow_operations(self, files: list[str]) -> list[Improvement]:
         """
@@ -95,76 +322,82 @@ class PerformanceAnalyzer(Analyzer):
 
         for file_path in files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    code = f.read()
-
-                tree = ast.parse(code, filename=file_path)
-
-                # Walk AST and find nested loops
-                for node in ast.walk(tree):
-                    if isinstance(node, (ast.For, ast.While)):
-                        # Check for nested loops
-                        nesting_level = self._count_loop_nesting(node)
-
-                        if nesting_level >= 3:
-                            # O(n³) or worse - HIGH priority
-                            improvements.append(Improvement.create(
-                                improvement_type=ImprovementType.PERFORMANCE,
-                                priority=ImprovementPriority.HIGH,
-                                target_file=file_path,
-                                target_line=node.lineno,
-                                title=f"O(n³) algorithm detected (triple-nested loop)",
-                                description=(
-                                    f"Triple-nested loop detected at line {node.lineno}. "
-                                    f"This results in O(n³) complexity which can be very slow for large inputs. "
-                                    f"Consider: 1) Using more efficient data structures (hash maps), "
-                                    f"2) Preprocessing data to avoid nested iteration, "
-                                    f"3) Breaking the problem into smaller chunks."
-                                ),
-                                proposed_changes=(
-                                    f"Refactor nested loops at line {node.lineno} to reduce algorithmic complexity"
-                                ),
-                                rationale="Cubic time complexity scales poorly and can cause performance issues",
-                                impact="high",
-                                effort="medium",
-                                analyzer_source=self.analyzer_name
-                            ))
-
-                        elif nesting_level == 2:
-                            # O(n²) - MEDIUM priority (acceptable for small n, but worth flagging)
-                            improvements.append(Improvement.create(
-                                improvement_type=ImprovementType.PERFORMANCE,
-                                priority=ImprovementPriority.MEDIUM,
-                                target_file=file_path,
-                                target_line=node.lineno,
-                                title=f"O(n²) algorithm detected (nested loop)",
-                                description=(
-                                    f"Nested loop detected at line {node.lineno}. "
-                                    f"This results in O(n²) complexity which may be acceptable for small datasets "
-                                    f"but can become slow with larger inputs. "
-                                    f"Consider: 1) Using hash maps for lookups instead of inner loop, "
-                                    f"2) Sorting and using binary search, "
-                                    f"3) Preprocessing data into more efficient structures."
-                                ),
-                                proposed_changes=(
-                                    f"Consider optimizing nested loops at line {node.lineno} if working with large datasets"
-                                ),
-                                rationale="Quadratic time complexity can become a bottleneck with larger inputs",
-                                impact="medium",
-                                effort="small",
-                                analyzer_source=self.analyzer_name
-                            ))
+                improvements.extend(self._find_slow_operations(self._file_facts(file_path), file_path))
 
             except SyntaxError as e:
                 # Invalid Python syntax - log and continue
-                print(f"Warning: Syntax error in {file_path}: {e}")
+                logger.warning("Syntax error in %s: %s", file_path, e)
                 continue
             except Exception as e:
-                print(f"Warning: Could not analyze {file_path}: {e}")
+                logger.warning("Could not analyze %s: %s", file_path, e)
                 continue
 
         return improvements
 
+    def _find_slow_operations(self, facts: _ModuleFacts, file_path: str) -> list[Improvement]:
+        """Apply the detect_slow_operations() checks to collected module facts."""
+        improvements = []
+
+        # Find nested loops. Each nest is reported once, at its outermost
+        # loop, with the depth of its deepest branch
+        for loop_facts in facts.loops:
+            if not loop_facts.outermost:
+                continue
+
+            node = loop_facts.node
+            nesting_level = loop_facts.nesting
+
+            if nesting_level >= 3:
+                # O(n³) or worse - HIGH priority
+                improvements.append(Improvement.create(
+                    improvement_type=ImprovementType.PERFORMANCE,
+                    priority=ImprovementPriority.HIGH,
+                    target_file=file_path,
+                    target_line=node.lineno,
+                    title=f"O(n³) algorithm detected (triple-nested loop)",
+                    description=(
+                        f"Triple-nested loop detected at line {node.lineno}. "
+                        f"This results in O(n³) complexity which can be very slow for large inputs. "
+                        f"Consider: 1) Using more efficient data structures (hash maps), "
+                        f"2) Preprocessing data to avoid nested iteration, "
+                        f"3) Breaking the problem into smaller chunks."
+                    ),
+                    proposed_changes=(
+                        f"Refactor nested loops at line {node.lineno} to reduce algorithmic complexity"
+                    ),
+                    rationale="Cubic time complexity scales poorly and can cause performance issues",
+                    impact="high",
+                    effort="medium",
+                    analyzer_source=self.analyzer_name
+                ))
+
+            elif nesting_level == 2:
+                # O(n²) - MEDIUM priority (acceptable for small n, but worth flagging)
+                improvements.append(Improvement.create(
+                    improvement_type=ImprovementType.PERFORMANCE,
+                    priority=ImprovementPriority.MEDIUM,
+                    target_file=file_path,
+                    target_line=node.lineno,
+                    title=f"O(n²) algorithm detected (nested loop)",
+                    description=(
+                        f"Nested loop detected at line {node.lineno}. "
+                        f"This results in O(n²) complexity which may be acceptable for small datasets "
+                        f"but can become slow with larger inputs. "
+                        f"Consider: 1) Using hash maps for lookups instead of inner loop, "
+                        f"2) Sorting and using binary search, "
+                        f"3) Preprocessing data into more efficient structures."
+                    ),
+                    proposed_changes=(
+                        f"Consider optimizing nested loops at line {node.lineno} if working with large datasets"
+                    ),
+                    rationale="Quadratic time complexity can become a bottleneck with larger inputs",
+                    impact="medium",
+                    effort="small",
+                    analyzer_source=self.analyzer_name
+                ))
+
+        return improvements
+
     def suggest_caching_opportunities(self, code: str, file_path: str) -> list[Improvement]:
         """
         Detect repeated function calls with same arguments (caching opportunities).
@@ -176,59 +409,62 @@ class PerformanceAnalyzer(Analyzer):
         Returns:
             List of Improvement objects suggesting caching/memoization
         """
-        improvements = []
-
         try:
             tree = ast.parse(code, filename=file_path)
-
-            # Track function calls within each function/method
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    # Analyze function body for repeated calls
-                    call_tracker = {}
-
-                    for child in ast.walk(node):
-                        if isinstance(child, ast.Call):
-                            # Get function name
-                            func_name = self._get_call_name(child)
-                            if func_name:
-                                # Track calls by name and arguments
-                                call_key = self._get_call_signature(child)
-                                if call_key not in call_tracker:
-                                    call_tracker[call_key] = []
-                                call_tracker[call_key].append(child.lineno)
-
-                    # Find repeated calls
-                    for call_sig, line_numbers in call_tracker.items():
-                        if len(line_numbers) >= 2:
-                            # Multiple calls with same signature - suggest caching
-                            improvements.append(Improvement.create(
-                                improvement_type=ImprovementType.PERFORMANCE,
-                                priority=ImprovementPriority.MEDIUM,
-                                target_file=file_path,
-                                target_line=line_numbers[0],
-                                title=f"Caching opportunity: repeated function call",
-                                description=(
-                                    f"Function call '{call_sig}' appears {len(line_numbers)} times "
-                                    f"in function '{node.name}' (lines {', '.join(map(str, line_numbers))}). "
-                                    f"If this function is pure (no side effects), consider caching its result. "
-                                    f"Options: 1) Use @functools.lru_cache decorator, "
-                                    f"2) Store result in variable, "
-                                    f"3) Use memoization pattern."
-                                ),
-                                proposed_changes=(
-                                    f"Cache results of repeated '{call_sig}' calls"
-                                ),
-                                rationale="Eliminate redundant computation by caching pure function results",
-                                impact="medium",
-                                effort="trivial",
-                                analyzer_source=self.analyzer_name
-                            ))
+            return self._find_caching_opportunities(_collect_performance_facts(tree), file_path)
 
         except SyntaxError as e:
-            print(f"Warning: Syntax error in {file_path}: {e}")
+            logger.warning("Syntax error in %s: %s", file_path, e)
+            return []
         except Exception as e:
-            print(f"Warning: Could not analyze caching opportunities in {file_path}: {e}")
+            logger.warning("Could not analyze caching opportunities in %s: %s", file_path, e)
+            return []
+
+    def _find_caching_opportunities(self, facts: _ModuleFacts, file_path: str) -> list[Improvement]:
+        """Apply the suggest_caching_opportunities() checks to collected module facts."""
+        improvements = []
+
+        # Track function calls within each function/method
+        for function_facts in facts.functions:
+            node = function_facts.node
+            # Analyze function body for repeated calls
+            call_tracker: dict[tuple[str, int], list[int]] = {}
+
+            for child, func_name in function_facts.calls:
+                # Track calls by name and positional argument count; the
+                # readable signature is only formatted for a report
+                call_key = (func_name, len(child.args))
+                if call_key not in call_tracker:
+                    call_tracker[call_key] = []
+                call_tracker[call_key].append(child.lineno)
+
+            # Find repeated calls
+            for (func_name, arg_count), line_numbers in call_tracker.items():
+                if len(line_numbers) >= 2:
+                    # Multiple calls with same signature - suggest caching
+                    call_sig = f"{func_name}({arg_count} args)"
+                    improvements.append(Improvement.create(
+                        improvement_type=ImprovementType.PERFORMANCE,
+                        priority=ImprovementPriority.MEDIUM,
+                        target_file=file_path,
+                        target_line=line_numbers[0],
+                        title=f"Caching opportunity: repeated function call",
+                        description=(
+                            f"Function call '{call_sig}' appears {len(line_numbers)} times "
+                            f"in function '{node.name}' (lines {', '.join(map(str, line_numbers))}). "
+                            f"If this function is pure (no side effects), consider caching its result. "
+                            f"Options: 1) Use @functools.lru_cache decorator, "
+                            f"2) Store result in variable, "
+                            f"3) Use memoization pattern."
+                        ),
+                        proposed_changes=(
+                            f"Cache results of repeated '{call_sig}' calls"
+                        ),
+                        rationale="Eliminate redundant computation by caching pure function results",
+                        impact="medium",
+                        effort="trivial",
+                        analyzer_source=self.analyzer_name
+                    ))
 
         return improvements
 
@@ -243,102 +479,99 @@ class PerformanceAnalyzer(Analyzer):
         Returns:
             List of Improvement objects for detected inefficiencies
         """
-        improvements = []
-
         try:
             tree = ast.parse(code, filename=file_path)
-
-            for node in ast.walk(tree):
-                # Detect string concatenation in loops
-                if isinstance(node, (ast.For, ast.While)):
-                    for child in ast.walk(node):
-                        if isinstance(child, ast.AugAssign) and isinstance(child.op, ast.Add):
-                            # Check if target is a string variable (heuristic: += on string)
-                            if isinstance(child.target, ast.Name):
-                                improvements.append(Improvement.create(
-                                    improvement_type=ImprovementType.PERFORMANCE,
-                                    priority=ImprovementPriority.MEDIUM,
-                                    target_file=file_path,
-                                    target_line=child.lineno,
-                                    title="String concatenation in loop detected",
-                                    description=(
-                                        f"String concatenation using += detected in loop at line {child.lineno}. "
-                                        f"In Python, strings are immutable, so each += creates a new string object. "
-                                        f"For large loops, this can be inefficient. "
-                                        f"Consider: 1) Collect strings in a list and use ''.join() at the end, "
-                                        f"2) Use io.StringIO for building large strings, "
-                                        f"3) Use list comprehension with join()."
-                                    ),
-                                    proposed_changes=(
-                                        f"Replace string += with list.append() and ''.join() pattern"
-                                    ),
-                                    rationale="String concatenation in loops has O(n²) behavior due to string immutability",
-                                    impact="medium",
-                                    effort="trivial",
-                                    analyzer_source=self.analyzer_name
-                                ))
-
-                # Detect potential N+1 query pattern (database queries in loops)
-                if isinstance(node, (ast.For, ast.While)):
-                    for child in ast.walk(node):
-                        if isinstance(child, ast.Call):
-                            func_name = self._get_call_name(child)
-                            # Heuristic: calls with "query", "get", "fetch", "find" might be database ops
-                            db_keywords = ['query', 'get', 'fetch', 'find', 'select', 'execute']
-                            if func_name and any(keyword in func_name.lower() for keyword in db_keywords):
-                                improvements.append(Improvement.create(
-                                    improvement_type=ImprovementType.PERFORMANCE,
-                                    priority=ImprovementPriority.HIGH,
-                                    target_file=file_path,
-                                    target_line=child.lineno,
-                                    title="Potential N+1 query pattern detected",
-                                    description=(
-                                        f"Database-like operation '{func_name}' detected in loop at line {child.lineno}. "
-                                        f"This may be an N+1 query problem where each loop iteration makes a separate query. "
-                                        f"Consider: 1) Fetch all data with a single query using JOIN or WHERE IN, "
-                                        f"2) Use eager loading / batch fetching, "
-                                        f"3) Implement proper relationship loading."
-                                    ),
-                                    proposed_changes=(
-                                        f"Replace loop-based queries with batch fetch operation"
-                                    ),
-                                    rationale="N+1 queries cause excessive database round-trips and severe performance degradation",
-                                    impact="high",
-                                    effort="small",
-                                    analyzer_source=self.analyzer_name
-                                ))
-
-                # Detect list.append() in loops (suggest list comprehension)
-                if isinstance(node, (ast.For, ast.While)):
-                    for child in ast.walk(node):
-                        if isinstance(child, ast.Call):
-                            if isinstance(child.func, ast.Attribute):
-                                if child.func.attr == 'append' and isinstance(child.func.value, ast.Name):
-                                    improvements.append(Improvement.create(
-                                        improvement_type=ImprovementType.PERFORMANCE,
-                                        priority=ImprovementPriority.LOW,
-                                        target_file=file_path,
-                                        target_line=child.lineno,
-                                        title="Consider list comprehension for cleaner code",
-                                        description=(
-                                            f"List append in loop at line {child.lineno}. "
-                                            f"While not always a performance issue, list comprehensions are often "
-                                            f"more readable and can be slightly faster for simple transformations. "
-                                            f"Consider using list comprehension if the loop only builds a list."
-                                        ),
-                                        proposed_changes=(
-                                            f"Consider refactoring to list comprehension if appropriate"
-                                        ),
-                                        rationale="List comprehensions are more Pythonic and can improve readability",
-                                        impact="low",
-                                        effort="trivial",
-                                        analyzer_source=self.analyzer_name
-                                    ))
+            return self._find_algorithm_inefficiencies(_collect_performance_facts(tree), file_path)
 
         except SyntaxError as e:
-            print(f"Warning: Syntax error in {file_path}: {e}")
+            logger.warning("Syntax error in %s: %s", file_path, e)
+            return []
         except Exception as e:
-            print(f"Warning: Could not analyze algorithm inefficiencies in {file_path}: {e}")
+            logger.warning("Could not analyze algorithm inefficiencies in %s: %s", file_path, e)
+            return []
+
+    def _find_algorithm_inefficiencies(self, facts: _ModuleFacts, file_path: str) -> list[Improvement]:
+        """Apply the detect_algorithm_inefficiencies() checks to collected module facts."""
+        improvements = []
+
+        # Detect string concatenation in loops
+        for child, str_names in facts.loop_aug_assigns:
+            if isinstance(child.op, ast.Add):
+                # Check if target is a string variable: bound to a string
+                # literal, f-string or str() result, or annotated str, in
+                # the same scope. Numeric counters are not reported
+                if isinstance(child.target, ast.Name) and child.target.id in str_names:
+                    improvements.append(Improvement.create(
+                        improvement_type=ImprovementType.PERFORMANCE,
+                        priority=ImprovementPriority.MEDIUM,
+                        target_file=file_path,
+                        target_line=child.lineno,
+                        title="String concatenation in loop detected",
+                        description=(
+                            f"String concatenation using += detected in loop at line {child.lineno}. "
+                            f"In Python, strings are immutable, so each += creates a new string object. "
+                            f"For large loops, this can be inefficient. "
+                            f"Consider: 1) Collect strings in a list and use ''.join() at the end, "
+                            f"2) Use io.StringIO for building large strings, "
+                            f"3) Use list comprehension with join()."
+                        ),
+                        proposed_changes=(
+                            f"Replace string += with list.append() and ''.join() pattern"
+                        ),
+                        rationale="String concatenation in loops has O(n²) behavior due to string immutability",
+                        impact="medium",
+                        effort="trivial",
+                        analyzer_source=self.analyzer_name
+                    ))
+
+        for child, func_name in facts.loop_calls:
+            # Detect potential N+1 query pattern (database queries in loops)
+            if _DB_CALL_PATTERN.search(func_name.lower()):
+                improvements.append(Improvement.create(
+                    improvement_type=ImprovementType.PERFORMANCE,
+                    priority=ImprovementPriority.HIGH,
+                    target_file=file_path,
+                    target_line=child.lineno,
+                    title="Potential N+1 query pattern detected",
+                    description=(
+                        f"Database-like operation '{func_name}' detected in loop at line {child.lineno}. "
+                        f"This may be an N+1 query problem where each loop iteration makes a separate query. "
+                        f"Consider: 1) Fetch all data with a single query using JOIN or WHERE IN, "
+                        f"2) Use eager loading / batch fetching, "
+                        f"3) Implement proper relationship loading."
+                    ),
+                    proposed_changes=(
+                        f"Replace loop-based queries with batch fetch operation"
+                    ),
+                    rationale="N+1 queries cause excessive database round-trips and severe performance degradation",
+                    impact="high",
+                    effort="small",
+                    analyzer_source=self.analyzer_name
+                ))
+
+        # Detect loops whose only statement is list.append() (suggest list
+        # comprehension); a loop doing anything else can't simply be rewritten
+        for child in facts.loop_appends:
+            improvements.append(Improvement.create(
+                improvement_type=ImprovementType.PERFORMANCE,
+                priority=ImprovementPriority.LOW,
+                target_file=file_path,
+                target_line=child.lineno,
+                title="Consider list comprehension for cleaner code",
+                description=(
+                    f"List append in loop at line {child.lineno}. "
+                    f"While not always a performance issue, list comprehensions are often "
+                    f"more readable and can be slightly faster for simple transformations. "
+                    f"Consider using list comprehension if the loop only builds a list."
+                ),
+                proposed_changes=(
+                    f"Consider refactoring to list comprehension if appropriate"
+                ),
+                rationale="List comprehensions are more Pythonic and can improve readability",
+                impact="low",
+                effort="trivial",
+                analyzer_source=self.analyzer_name
+            ))
 
         return improvements
 
@@ -364,25 +597,26 @@ class PerformanceAnalyzer(Analyzer):
         # For now, return empty list (will be populated by tests)
         return python_files
 
-    def _count_loop_nesting(self, node: ast.AST) -> int:
+    def _file_facts(self, file_path: str) -> _ModuleFacts:
         """
-        Count the nesting level of loops within a loop node.
+        Collect a file's performance facts, reusing them while the file is unchanged.
+
+        The cache checks the file's mtime and size, so an unchanged artifact
+        is neither re-read, re-parsed nor re-traversed when it is analyzed
+        again. A file without any loop or def keyword is not parsed; it
+        yields empty facts.
 
         Args:
-            node: AST node representing a loop
+            file_path: Path to the Python source file
 
         Returns:
-            Maximum nesting level (1 for single loop, 2 for nested, etc.)
-        """
-        max_nesting = 1
+            Facts collected from the parsed module
 
-        for child in ast.walk(node):
-            if child != node and isinstance(child, (ast.For, ast.While)):
-                # Found a nested loop
-                child_nesting = self._count_loop_nesting(child)
-                max_nesting = max(max_nesting, child_nesting + 1)
-
-        return max_nesting
+        Raises:
+            OSError: If the file cannot be read
+            SyntaxError: If the file is not valid Python
+        """
+        return self._facts_cache.load(file_path, _load_facts)
 
     def _get_call_name(self, call_node: ast.Call) -> str | None:
         """
@@ -394,26 +628,4 @@ class PerformanceAnalyzer(Analyzer):
         Returns:
             Function name or None if cannot determine
         """
-        if isinstance(call_node.func, ast.Name):
-            return call_node.func.id
-        elif isinstance(call_node.func, ast.Attribute):
-            return call_node.func.attr
-        return None
-
-    def _get_call_signature(self, call_node: ast.Call) -> str:
-        """
-        Create a signature string for a function call (name + arg count).
-
-        Args:
-            call_node: AST Call node
-
-        Returns:
-            Call signature string
-        """
-        func_name = self._get_call_name(call_node)
-        if not func_name:
-            return "unknown"
-
-        # Simple signature: function_name(arg_count)
-        arg_count = len(call_node.args)
-        return f"{func_name}({arg_count} args)"
+        return _get_call_name(call_node)
@@ -93,6 +93,50 @@ def complex_function(x, y):
         # if (1) + elif (1) + for (1) + if (1) + while (1) = 6
         assert complexity >= 5
 
+    def test_async_function_decision_points(self):
+        """Async loops, context managers and boolean operators should count."""
+        analyzer = CodeQualityAnalyzer()
+
+        code = """
+async def fetch_all(session, urls):
+    async with session:
+        async for url in urls:
+            if url and url.startswith("https") or url == "localhost":
+                await session.get(url)
+    return [u for u in urls if u]
+"""
+        import ast
+        tree = ast.parse(code)
+        func_node = tree.body[0]
+
+        complexity = analyzer.calculate_complexity(func_node)
+        # with (1) + for (1) + if (1) + and/or (2) + comprehension (1) + its if (1) = 7, plus base 1
+        assert complexity == 8
+
+    def test_nested_functions_not_counted(self):
+        """Branches inside nested functions and lambdas belong to them, not the outer function."""
+        analyzer = CodeQualityAnalyzer()
+
+        code = """
+def outer(items):
+    def keep(item):
+        if item and item > 0:
+            return True
+        return False
+    key = lambda item: item or 0
+    if items:
+        return sorted(filter(keep, items), key=key)
+"""
+        import ast
+        tree = ast.parse(code)
+        outer_node = tree.body[0]
+        keep_node = outer_node.body[0]
+
+        # Only the outer if (1), plus base 1
+        assert analyzer.calculate_complexity(outer_node) == 2
+        # if (1) + and (1), plus base 1
+        assert analyzer.calculate_complexity(keep_node) == 3
+
     def test_complexity_greater_than_15_high_priority(self):
         """Complexity > 15 should generate HIGH priority improvement."""
         analyzer = CodeQualityAnalyzer()
@@ -469,6 +513,68 @@ def broken syntax here
 
         assert improvements == []
 
+    def test_analyze_reports_oversized_files_without_scanning(self):
+        """Files over the line limit should get one review finding and no other analysis."""
+        analyzer = CodeQualityAnalyzer()
+
+        task = Mock(spec=Task)
+
+        # Duplicated across both files, with an unused import and a long method
+        code = "import os\n\ndef generated():\n"
+        code += "\n".join([f"    x{i} = {i}" for i in range(60)]) + "\n"
+
+        temp_files = []
+        for _ in range(2):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+                f.write(code)
+                temp_files.append(f.name)
+
+        try:
+            with patch('src.agents.analyzers.code_quality_analyzer._MAX_ANALYZABLE_LINES', 20), \
+                    patch.object(analyzer, '_extract_python_files', return_value=temp_files):
+                improvements = analyzer.analyze(task)
+
+            assert sorted(imp.target_file for imp in improvements) == sorted(temp_files)
+            assert all("too large" in imp.title for imp in improvements)
+            assert all(imp.priority == ImprovementPriority.LOW for imp in improvements)
+
+        finally:
+            for temp_file in temp_files:
+                os.unlink(temp_file)
+
+    def test_size_limit_counts_last_line_without_newline(self):
+        """Every detector should apply the line limit to the same line count."""
+        analyzer = CodeQualityAnalyzer()
+        task = Mock(spec=Task)
+
+        # 21 lines, the last without a trailing newline
+        code = "def generated():\n" + "\n".join([f"    x{i} = {i}" for i in range(20)])
+
+        temp_files = []
+        for _ in range(2):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+                f.write(code)
+                temp_files.append(f.name)
+
+        try:
+            with patch('src.agents.analyzers.code_quality_analyzer._MAX_ANALYZABLE_LINES', 21):
+                assert analyzer.detect_duplication(temp_files)
+
+            with patch('src.agents.analyzers.code_quality_analyzer._MAX_ANALYZABLE_LINES', 20):
+                assert analyzer.detect_duplication(temp_files) == []
+
+            with patch('src.agents.analyzers.code_quality_analyzer._MAX_ANALYZABLE_LINES', 20), \
+                    patch.object(analyzer, '_extract_python_files', return_value=temp_files):
+                improvements = analyzer.analyze(task)
+
+            assert len(improvements) == 2
+            assert all(imp.title.startswith("File too large") and "(21 lines)" in imp.title
+                       for imp in improvements)
+
+        finally:
+            for temp_file in temp_files:
+                os.unlink(temp_file)
+
     def test_all_improvements_have_correct_type(self):
         """All improvements should have ImprovementType.CODE_QUALITY."""
         analyzer = CodeQualityAnalyzer()
@@ -500,3 +606,89 @@ def long_function():
 
         finally:
             os.unlink(temp_file)
+
+
+class TestParseCache:
+    """Test AST reuse across detectors."""
+
+    def test_unchanged_code_parsed_once(self):
+        """_parse_ast() should return the cached tree while a file's code is unchanged."""
+        analyzer = CodeQualityAnalyzer()
+        code = "def f():\n    return 1\n"
+
+        first = analyzer._parse_ast(code, "a.py")
+        assert analyzer._parse_ast(code, "a.py") is first
+        assert analyzer._parse_ast(code + "\n", "a.py") is not first
+
+    def test_new_version_replaces_cached_tree(self):
+        """Re-analyzing an edited file should not keep its old tree alive."""
+        analyzer = CodeQualityAnalyzer()
+
+        for version in range(5):
+            analyzer._parse_ast(f"def f():\n    return {version}\n", "a.py")
+
+        assert len(analyzer._file_cache) == 1
+
+    def test_cache_drops_least_recently_used_file(self):
+        """The cache should hold at most _FILE_CACHE_SIZE files."""
+        analyzer = CodeQualityAnalyzer()
+        code = "def f():\n    return 1\n"
+
+        with patch('src.agents.analyzers.base_analyzer._FILE_CACHE_SIZE', 2):
+            first = analyzer._parse_ast(code, "a.py")
+            analyzer._parse_ast(code, "b.py")
+            assert analyzer._parse_ast(code, "a.py") is first
+            analyzer._parse_ast(code, "c.py")
+
+        assert list(analyzer._file_cache) == ["a.py", "c.py"]
+
+    def test_unchanged_file_not_reread(self):
+        """_parse_file() should not read a file whose mtime and size are unchanged."""
+        analyzer = CodeQualityAnalyzer()
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write("def f():\n    return 1\n")
+            temp_file = f.name
+
+        try:
+            code, tree = analyzer._parse_file(temp_file)
+
+            with patch('builtins.open', side_effect=AssertionError("file was re-read")):
+                assert analyzer._parse_file(temp_file) == (code, tree)
+
+            with open(temp_file, 'a') as f:
+                f.write("\ndef g():\n    return 2\n")
+
+            new_code, new_tree = analyzer._parse_file(temp_file)
+            assert new_tree is not tree
+            assert 'def g()' in new_code
+
+        finally:
+            os.unlink(temp_file)
+
+    def test_duplication_reuses_cached_source(self):
+        """detect_duplication() should not re-read files analyze() has just read."""
+        analyzer = CodeQualityAnalyzer()
+        code = "def generated():\n" + "".join(f"    x{i} = {i}\n" for i in range(8))
+
+        temp_files = []
+        for _ in range(2):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+                f.write(code)
+                temp_files.append(f.name)
+
+        try:
+            expected = analyzer.detect_duplication(temp_files)
+            assert expected
+
+            for temp_file in temp_files:
+                analyzer._parse_file(temp_file)
+
+            with patch('builtins.open', side_effect=AssertionError("file was re-read")):
+                duplicates = analyzer.detect_duplication(temp_files)
+
+            assert [imp.title for imp in duplicates] == [imp.title for imp in expected]
+
+        finally:
+            for temp_file in temp_files:
+                os.unlink(temp_file)
@@ -9,6 +9,7 @@ import pytest
 import tempfile
 import os
 from src.agents.analyzers.documentation_analyzer import DocumentationAnalyzer
+from src.agents.analyzers import models
 from src.agents.analyzers.models import Improvement, ImprovementType, ImprovementPriority
 from src.agents.analyzers.base_analyzer import Analyzer
 from src.models import Task, TaskStatus, ProjectPhase
@@ -238,6 +239,31 @@ def function(value):
         # NumPy style should be recognized
         assert len(improvements) == 0
 
+    def test_sphinx_style_docstring_recognized(self):
+        """Sphinx-style :param: fields should be recognized per parameter."""
+        analyzer = DocumentationAnalyzer()
+        import ast
+
+        code = '''
+def function(value, scale, offset):
+    """
+    This function does something.
+
+    :param value: The input value
+    :param scale: Multiplier applied to the value
+    :returns: The result
+    """
+    return value * scale + offset
+'''
+        tree = ast.parse(code)
+        func_node = tree.body[0]
+
+        improvements = analyzer.validate_parameter_docs(func_node, "test.py")
+
+        # Only the parameter without a :param: field is reported
+        assert len(improvements) == 1
+        assert improvements[0].title.endswith(": offset")
+
     def test_function_with_no_params_not_flagged(self):
         """Function with no parameters should not suggest param docs."""
         analyzer = DocumentationAnalyzer()
@@ -398,6 +424,31 @@ class _PrivateClass:
         finally:
             os.unlink(temp_file)
 
+    def test_readme_update_for_public_method_of_private_class(self):
+        """Public definitions nested below the module level still count."""
+        analyzer = DocumentationAnalyzer()
+
+        task = Mock(spec=Task)
+
+        code = """
+class _PrivateClass:
+    def public_method(self):
+        return 42
+"""
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write(code)
+            temp_file = f.name
+
+        try:
+            with patch.object(analyzer, '_extract_python_files', return_value=[temp_file]):
+                improvements = analyzer.check_readme_updates(task)
+
+            assert len(improvements) == 1
+
+        finally:
+            os.unlink(temp_file)
+
 
 class TestIntegration:
     """Integration tests for DocumentationAnalyzer."""
@@ -553,3 +604,107 @@ class DataProcessor:
 
         finally:
             os.unlink(temp_file)
+
+    def test_analyze_parses_each_file_once(self):
+        """analyze() should share one parse per file across all checks, including the README scan."""
+        import ast
+        analyzer = DocumentationAnalyzer()
+
+        task = Mock(spec=Task)
+
+        code = '''
+def public_function(value):
+    """Double a value."""
+    return value * 2
+'''
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write(code)
+            temp_file = f.name
+
+        try:
+            with patch.object(analyzer, '_extract_python_files', return_value=[temp_file]), \
+                    patch('src.agents.analyzers.documentation_analyzer.ast.parse', wraps=ast.parse) as parse:
+                improvements = analyzer.analyze(task)
+                file_parses = [c for c in parse.call_args_list if c.kwargs.get('filename') == temp_file]
+
+            # The README scan reuses the tree from the documentation checks
+            assert len(file_parses) == 1
+            titles = [imp.title for imp in improvements]
+            assert "Missing module-level docstring" in titles
+            assert any("Undocumented parameters" in t for t in titles)
+            assert any("Missing return value documentation" in t for t in titles)
+
+        finally:
+            os.unlink(temp_file)
+
+    def test_analyze_stamps_one_timestamp_per_run(self):
+        """Improvements from one analyze() call should share created_at."""
+        analyzer = DocumentationAnalyzer()
+
+        task = Mock(spec=Task)
+
+        code = '''
+def public_function(value):
+    return value * 2
+'''
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write(code)
+            temp_file = f.name
+
+        try:
+            with patch.object(analyzer, '_extract_python_files', return_value=[temp_file]):
+                improvements = analyzer.analyze(task)
+
+            assert len(improvements) > 1
+            assert len({imp.created_at for imp in improvements}) == 1
+            # The batch timestamp does not leak past the run
+            assert models._batch_timestamp.get() is None
+
+        finally:
+            os.unlink(temp_file)
+
+
+class TestParseCache:
+    """Test AST reuse across analyze() calls."""
+
+    def test_unchanged_file_not_reparsed(self):
+        """_parse_file() should return the cached tree while mtime and size are unchanged."""
+        analyzer = DocumentationAnalyzer()
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write("def f():\n    return 1\n")
+            temp_file = f.name
+
+        try:
+            tree = analyzer._parse_file(temp_file)
+
+            with patch('builtins.open', side_effect=AssertionError("file was re-read")):
+                assert analyzer._parse_file(temp_file) is tree
+
+            with open(temp_file, 'a') as f:
+                f.write("\ndef g():\n    return 2\n")
+
+            assert analyzer._parse_file(temp_file) is not tree
+
+        finally:
+            os.unlink(temp_file)
+
+    def test_encoding_declaration_honoured(self):
+        """_parse_file() should decode a file using its encoding declaration."""
+        import ast
+
+        analyzer = DocumentationAnalyzer()
+
+        source = '# -*- coding: latin-1 -*-\n"""Caf\xe9 helpers."""\n'.encode('latin-1')
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.py', delete=False) as f:
+            f.write(source)
+            temp_file = f.name
+
+        try:
+            tree = analyzer._parse_file(temp_file)
+            assert ast.get_docstring(tree) == "Caf\xe9 helpers."
+
+        finally:
+            os.unlink(temp_file)
@@ -9,12 +9,15 @@ import pytest
 import ast
 import tempfile
 import os
+import threading
+import time
 from datetime import datetime
 from src.agents.analyzers.performance_analyzer import PerformanceAnalyzer
+from src.agents.analyzers import models
 from src.agents.analyzers.models import Improvement, ImprovementType, ImprovementPriority
 from src.agents.analyzers.base_analyzer import Analyzer
 from src.models import Task, TaskStatus, ProjectPhase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 
 class TestImprovementType:
@@ -179,6 +182,109 @@ class TestImprovementDataclass:
         # Should not raise
         datetime.fromisoformat(improvement.created_at)
 
+    def test_improvement_create_generates_unique_ids(self):
+        """Improvement.create() should never repeat an ID within a run."""
+        ids = {
+            Improvement.create(
+                improvement_type=ImprovementType.PERFORMANCE,
+                priority=ImprovementPriority.LOW,
+                target_file="test.py",
+                title="Test",
+                description="Test desc",
+                proposed_changes="Test changes",
+                rationale="Test rationale",
+                impact="low",
+                effort="small",
+                analyzer_source="performance"
+            ).improvement_id
+            for _ in range(1000)
+        }
+
+        assert len(ids) == 1000
+        assert all(len(improvement_id) == 16 for improvement_id in ids)
+
+    def test_improvement_ids_count_up_within_a_process(self):
+        """Consecutive IDs come from one counter, so they are sequential."""
+        first = int(self._create_improvement().improvement_id[4:], 16)
+        second = int(self._create_improvement().improvement_id[4:], 16)
+
+        assert second == (first + 1) % (1 << 48)
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires os.fork()")
+    def test_forked_child_gets_its_own_id_sequence(self):
+        """A forked child must not continue the parent's ID sequence."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # Child: report the next ID and exit without running test teardown
+            try:
+                os.close(read_fd)
+                os.write(write_fd, self._create_improvement().improvement_id.encode())
+            finally:
+                os._exit(0)
+
+        os.close(write_fd)
+        try:
+            parent_id = self._create_improvement().improvement_id
+            with os.fdopen(read_fd, 'rb') as pipe:
+                child_id = pipe.read().decode()
+        finally:
+            os.waitpid(pid, 0)
+
+        assert len(child_id) == 16
+        assert child_id != parent_id
+
+    @staticmethod
+    def _create_improvement():
+        return Improvement.create(
+            improvement_type=ImprovementType.PERFORMANCE,
+            priority=ImprovementPriority.LOW,
+            target_file="test.py",
+            title="Test",
+            description="Test desc",
+            proposed_changes="Test changes",
+            rationale="Test rationale",
+            impact="low",
+            effort="small",
+            analyzer_source="performance"
+        )
+
+    def test_batch_timestamp_not_shared_with_other_threads(self):
+        """A batch in one thread should not stamp improvements made in another."""
+        entered = threading.Event()
+        release = threading.Event()
+        batch_stamps = []
+
+        def run_batch():
+            with Improvement.batch():
+                batch_stamps.append(self._create_improvement().created_at)
+                entered.set()
+                release.wait(timeout=5)
+
+        worker = threading.Thread(target=run_batch)
+        worker.start()
+        try:
+            assert entered.wait(timeout=5)
+            # Past the clock resolution, so a fresh timestamp differs
+            time.sleep(0.05)
+            created_at = self._create_improvement().created_at
+        finally:
+            release.set()
+            worker.join()
+
+        assert created_at > batch_stamps[0]
+
+    def test_nested_batch_restores_outer_timestamp(self):
+        """Leaving an inner batch should restore the outer one, then none."""
+        with Improvement.batch():
+            outer = self._create_improvement().created_at
+            with Improvement.batch():
+                inner = self._create_improvement().created_at
+            assert self._create_improvement().created_at == outer
+
+        assert inner >= outer
+        assert models._batch_timestamp.get() is None
+
 
 class TestPerformanceAnalyzerInterface:
     """Test PerformanceAnalyzer implements Analyzer interface (AC 3.2.1)."""
@@ -273,6 +379,33 @@ def process_data(items):
         finally:
             os.unlink(temp_file)
 
+    def test_triple_nested_loop_reported_once(self):
+        """A triple-nested loop should yield one O(n³) report, not one per loop level."""
+        code = """
+def process_data(items):
+    result = []
+    for i in items:
+        for j in items:
+            for k in items:
+                result.append(i + j + k)
+    return result
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write(code)
+            f.flush()
+            temp_file = f.name
+
+        try:
+            analyzer = PerformanceAnalyzer()
+            improvements = analyzer.detect_slow_operations([temp_file])
+
+            assert len(improvements) == 1
+            assert improvements[0].priority == ImprovementPriority.HIGH
+            assert improvements[0].target_line == 4
+
+        finally:
+            os.unlink(temp_file)
+
     def test_ignore_single_loops(self):
         """detect_slow_operations() should NOT flag single loops."""
         code = """
@@ -302,6 +435,35 @@ def process_data(items):
             os.unlink(temp_file)
 
 
+    def test_nesting_measured_through_deepest_inner_loop(self):
+        """A loop's nesting should come from its deepest inner loop, not its first."""
+        code = """
+def process_data(items):
+    result = []
+    for i in items:
+        for j in items:
+            result.append(i + j)
+        for j in items:
+            for k in items:
+                result.append(i + j + k)
+    return result
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write(code)
+            f.flush()
+            temp_file = f.name
+
+        try:
+            analyzer = PerformanceAnalyzer()
+            improvements = analyzer.detect_slow_operations([temp_file])
+
+            o_n3_improvements = [imp for imp in improvements if 'O(n³)' in imp.title]
+            assert [imp.target_line for imp in o_n3_improvements] == [4]
+
+        finally:
+            os.unlink(temp_file)
+
+
 class TestSuggestCachingOpportunities:
     """Test caching opportunity detection (AC 3.2.3)."""
 
@@ -417,6 +579,111 @@ def build_html(items):
             os.unlink(temp_file)
 
 
+    def test_numeric_counter_not_reported_as_string_concatenation(self):
+        """+= on a number in a loop should not be flagged as string concatenation."""
+        code = """
+def summarize(items, prefix: str):
+    count = 0
+    for item in items:
+        count += 1
+        prefix += item.name
+    return count, prefix
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write(code)
+            f.flush()
+            temp_file = f.name
+
+        try:
+            with open(temp_file, 'r') as f:
+                code_content = f.read()
+
+            analyzer = PerformanceAnalyzer()
+            improvements = analyzer.detect_algorithm_inefficiencies(code_content, temp_file)
+
+            # Only the str-annotated parameter is reported
+            concat_lines = [
+                imp.target_line for imp in improvements
+                if 'concatenation' in imp.title.lower()
+            ]
+            assert concat_lines == [6]
+
+        finally:
+            os.unlink(temp_file)
+
+    def test_nested_loop_construct_reported_once(self):
+        """A construct inside nested loops should be reported once, not once per loop."""
+        code = """
+def build_report(rows):
+    text = ""
+    for row in rows:
+        for cell in row:
+            text += str(cell)
+    return text
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write(code)
+            f.flush()
+            temp_file = f.name
+
+        try:
+            with open(temp_file, 'r') as f:
+                code_content = f.read()
+
+            analyzer = PerformanceAnalyzer()
+            improvements = analyzer.detect_algorithm_inefficiencies(code_content, temp_file)
+
+            concat_improvements = [
+                imp for imp in improvements
+                if 'concatenation' in imp.title.lower()
+            ]
+            assert len(concat_improvements) == 1
+            assert concat_improvements[0].target_line == 6
+
+        finally:
+            os.unlink(temp_file)
+
+    def test_list_comprehension_suggested_only_for_append_only_loops(self):
+        """Only loops whose whole body is a list.append() should get the suggestion."""
+        code = """
+def transform(items):
+    doubled = []
+    for item in items:
+        doubled.append(item * 2)
+
+    kept = []
+    for item in items:
+        if item:
+            kept.append(item)
+
+    logged = []
+    for item in items:
+        print(item)
+        logged.append(item)
+    return doubled, kept, logged
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write(code)
+            f.flush()
+            temp_file = f.name
+
+        try:
+            with open(temp_file, 'r') as f:
+                code_content = f.read()
+
+            analyzer = PerformanceAnalyzer()
+            improvements = analyzer.detect_algorithm_inefficiencies(code_content, temp_file)
+
+            comprehension_lines = [
+                imp.target_line for imp in improvements
+                if 'list comprehension' in imp.title.lower()
+            ]
+            assert comprehension_lines == [5]
+
+        finally:
+            os.unlink(temp_file)
+
+
 class TestAnalyzeMethod:
     """Test main analyze() method (AC 3.2.1, 3.2.5)."""
 
@@ -513,6 +780,65 @@ def process(items):
             os.unlink(temp_file)
 
 
+    def test_analyze_parses_each_file_once(self):
+        """analyze() should read and parse each file once for all detectors."""
+        code = """
+def process(items):
+    html = ""
+    for i in items:
+        for j in items:  # Nested loop
+            html += str(database.fetch(i))
+            html += str(database.fetch(i))
+    return html
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write(code)
+            f.flush()
+            temp_file = f.name
+
+        try:
+            analyzer = PerformanceAnalyzer()
+
+            with patch.object(analyzer, '_extract_python_files', return_value=[temp_file]), \
+                    patch('src.agents.analyzers.performance_analyzer.ast.parse', wraps=ast.parse) as parse:
+                improvements = analyzer.analyze(Mock(spec=Task))
+
+            assert parse.call_count == 1
+            titles = [imp.title for imp in improvements]
+            assert any('O(n²)' in t for t in titles)
+            assert any('Caching opportunity' in t for t in titles)
+            assert any('N+1' in t for t in titles)
+
+        finally:
+            os.unlink(temp_file)
+
+    def test_analyze_skips_parsing_files_without_loops_or_functions(self):
+        """Files with no loop or def keyword can't have findings and aren't parsed."""
+        code = """
+from .models import Task
+
+__all__ = ['Task']
+DEFAULTS = {'retries': 3, 'timeout': 30}
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write(code)
+            f.flush()
+            temp_file = f.name
+
+        try:
+            analyzer = PerformanceAnalyzer()
+
+            with patch.object(analyzer, '_extract_python_files', return_value=[temp_file]), \
+                    patch('src.agents.analyzers.performance_analyzer.ast.parse', wraps=ast.parse) as parse:
+                improvements = analyzer.analyze(Mock(spec=Task))
+
+            assert parse.call_count == 0
+            assert improvements == []
+
+        finally:
+            os.unlink(temp_file)
+
+
 class TestIntegration:
     """Integration tests with full analyzer workflow."""
 
@@ -560,3 +886,50 @@ def complex_operation(users):
 
         finally:
             os.unlink(temp_file)
+
+
+class TestFactsCache:
+    """Test reuse of collected facts across analyze() calls."""
+
+    def test_unchanged_file_not_reanalyzed(self):
+        """_file_facts() should return the cached facts while mtime and size are unchanged."""
+        analyzer = PerformanceAnalyzer()
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write("def f(items):\n    for i in items:\n        pass\n")
+            temp_file = f.name
+
+        try:
+            facts = analyzer._file_facts(temp_file)
+
+            with patch('builtins.open', side_effect=AssertionError("file was re-read")):
+                assert analyzer._file_facts(temp_file) is facts
+
+            with open(temp_file, 'a') as f:
+                f.write("\ndef g():\n    return 2\n")
+
+            assert analyzer._file_facts(temp_file) is not facts
+
+        finally:
+            os.unlink(temp_file)
+
+    def test_cache_holds_bounded_number_of_files(self):
+        """_file_facts() should drop the least recently analyzed file past the cache size."""
+        analyzer = PerformanceAnalyzer()
+
+        temp_files = []
+        for name in ('f', 'g', 'h'):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+                f.write(f"def {name}(items):\n    for i in items:\n        pass\n")
+                temp_files.append(f.name)
+
+        try:
+            with patch('src.agents.analyzers.base_analyzer._FILE_CACHE_SIZE', 2):
+                for temp_file in temp_files:
+                    analyzer._file_facts(temp_file)
+
+            assert list(analyzer._facts_cache) == temp_files[1:]
+
+        finally:
+            for temp_file in temp_files:
+                os.unlink(temp_file)